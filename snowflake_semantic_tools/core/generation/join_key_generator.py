@@ -27,6 +27,8 @@ TEMPLATE_PATTERN = re.compile(r"{{\s*(?:column|ref)\s*\(\s*['\"]([^'\"]+)['\"]\s
 
 RESOLVED_COL_PATTERN = re.compile(r"([A-Z_][A-Z0-9_]*)\.([A-Z_][A-Z0-9_]*)", re.IGNORECASE)
 
+WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
 
 def has_wrapping_text(side_expr: str) -> bool:
     """Check if a join condition side has text wrapping a column reference.
@@ -38,7 +40,8 @@ def has_wrapping_text(side_expr: str) -> bool:
     if not side_expr:
         return False
 
-    tmpl_matches = list(TEMPLATE_PATTERN.finditer(side_expr))
+    # Templates always contain "{{", so resolved sides skip the template scan entirely
+    tmpl_matches = list(TEMPLATE_PATTERN.finditer(side_expr)) if "{{" in side_expr else []
     if tmpl_matches:
         if len(tmpl_matches) == 1 and side_expr == tmpl_matches[0].group(0).strip():
             return False
@@ -77,9 +80,10 @@ def detect_expression(side_expr: str) -> Optional[Dict[str, str]]:
     if not side_expr:
         return None
 
-    result = _detect_template_expression(side_expr)
-    if result:
-        return result
+    if "{{" in side_expr:
+        result = _detect_template_expression(side_expr)
+        if result:
+            return result
 
     return _detect_resolved_expression(side_expr)
 
@@ -135,7 +139,7 @@ def _detect_resolved_expression(side_expr: str) -> Optional[Dict[str, str]]:
 def _normalize_sql_expression(sql_expr: str) -> str:
     """Normalize a SQL expression: strip outer whitespace and collapse internal whitespace."""
     sql_expr = sql_expr.strip()
-    sql_expr = re.sub(r"\s+", " ", sql_expr)
+    sql_expr = WHITESPACE_RUN_PATTERN.sub(" ", sql_expr)
     return sql_expr
 
 
@@ -977,12 +977,9 @@ class SemanticViewBuilder:
                 logger.warning(f"No relationship conditions found for {rel_name}")
                 continue
 
-            parsed_conditions = []
-            for condition_row in rel_conditions:
-                join_condition = condition_row.get("JOIN_CONDITION")
-                if join_condition:
-                    parsed = JoinConditionParser.parse(join_condition)
-                    parsed_conditions.append(parsed)
+            parsed_conditions = JoinConditionParser.parse_many(
+                [row["JOIN_CONDITION"] for row in rel_conditions if row.get("JOIN_CONDITION")]
+            )
 
             if not parsed_conditions:
                 logger.warning(f"Could not parse conditions for {rel_name}")
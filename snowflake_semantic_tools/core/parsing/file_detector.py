@@ -12,12 +12,17 @@ Automatically identifies file types based on content patterns, supporting:
 Handles both valid YAML and files with Jinja templates through fallback pattern matching.
 """
 
+import functools
+import os
+import re
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Optional, Set, Tuple
 
 import yaml
 
 from snowflake_semantic_tools.shared.utils import get_logger
+from snowflake_semantic_tools.shared.utils.file_utils import safe_load_yaml
 
 logger = get_logger("file_detector")
 
@@ -46,27 +51,39 @@ class FileTypeDetector:
     - `models:` → dbt model definitions (physical layer)
     """
 
-    # Mapping of root keys to semantic types
-    SEMANTIC_TYPE_KEYS = {
-        "snowflake_metrics": "metrics",
-        "snowflake_relationships": "relationships",
-        "snowflake_filters": "filters",
-        "snowflake_custom_instructions": "custom_instructions",
-        "snowflake_verified_queries": "verified_queries",
-        "semantic_views": "semantic_views",
-        "models": "dbt",
-    }
+    # Mapping of root keys to semantic types (read-only: one detector is shared across parsers and threads)
+    SEMANTIC_TYPE_KEYS = MappingProxyType(
+        {
+            "snowflake_metrics": "metrics",
+            "snowflake_relationships": "relationships",
+            "snowflake_filters": "filters",
+            "snowflake_custom_instructions": "custom_instructions",
+            "snowflake_verified_queries": "verified_queries",
+            "semantic_views": "semantic_views",
+            "models": "dbt",
+        }
+    )
 
     # String patterns for fallback detection (when YAML parsing fails)
-    SEMANTIC_TYPE_PATTERNS = {
-        "snowflake_metrics:": "metrics",
-        "snowflake_relationships:": "relationships",
-        "snowflake_filters:": "filters",
-        "snowflake_custom_instructions:": "custom_instructions",
-        "snowflake_verified_queries:": "verified_queries",
-        "semantic_views:": "semantic_views",
-        "models:": "dbt",
-    }
+    SEMANTIC_TYPE_PATTERNS = MappingProxyType(
+        {
+            "snowflake_metrics:": "metrics",
+            "snowflake_relationships:": "relationships",
+            "snowflake_filters:": "filters",
+            "snowflake_custom_instructions:": "custom_instructions",
+            "snowflake_verified_queries:": "verified_queries",
+            "semantic_views:": "semantic_views",
+            "models:": "dbt",
+        }
+    )
+
+    # Single-pass scanner for all fallback patterns. The lookahead keeps matches zero-width
+    # so adjacent or overlapping patterns are all reported.
+    _PATTERN_SCANNER = re.compile("(?=(" + "|".join(re.escape(p) for p in SEMANTIC_TYPE_PATTERNS) + "))")
+
+    # Same idea for the bare root keys, matched against the raw file bytes.
+    # All root keys are ASCII, so they can be matched before (or without) decoding.
+    _KEY_SCANNER = re.compile(b"(?=(" + b"|".join(re.escape(k.encode("ascii")) for k in SEMANTIC_TYPE_KEYS) + b"))")
 
     @classmethod
     def detect_file_type(cls, file_path: Path) -> str:
@@ -107,15 +124,57 @@ class FileTypeDetector:
         specific root keys. If parsing fails (e.g., due to Jinja templates),
         it falls back to string pattern matching.
 
+        Results are cached per (path, mtime, size), so repeated detection of an
+        unchanged file (e.g. during catalog collection and again during parsing)
+        costs a single stat() call.
+
         Args:
             file_path: Path to the YAML file
 
         Returns:
             Semantic type (e.g., 'metrics', 'relationships', 'dbt') or None
         """
+        # Unchanged files (same path, mtime and size) are served from the detection cache.
+        # If the path can't be stat'ed, fall through to a direct, uncached detection.
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            stat_result = os.stat(file_path)
+        except (OSError, TypeError, ValueError):
+            return cls._detect_semantic_type_uncached(file_path)
+
+        return cls._detect_semantic_type_cached(
+            os.path.abspath(file_path), stat_result.st_mtime_ns, stat_result.st_size
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=2048)
+    def _detect_semantic_type_cached(cls, file_path: str, mtime_ns: int, size: int) -> Optional[str]:
+        """Cached detection keyed by (absolute path, mtime, size); the stat fields only form the cache key."""
+        return cls._detect_semantic_type_uncached(Path(file_path))
+
+    @classmethod
+    def _detect_semantic_type_uncached(cls, file_path: Path) -> Optional[str]:
+        """Detect the semantic type by reading and classifying the file contents."""
+        # Treat any OS-level failure (missing file, directory, permissions) as unclassifiable
+        try:
+            raw_content, keys_found = cls._read_and_scan_keys(file_path)
+        except OSError as e:
+            logger.debug(f"Could not read {file_path} for type detection: {e}")
+            return None
+
+        # Neither detection tier can match unless a known root key appears somewhere
+        if not keys_found:
+            return None
+
+        # With a single known key in the file, both tiers resolve to its type as soon as
+        # the "key:" pattern is present, so the full YAML parse can be skipped
+        if len(keys_found) == 1:
+            (key,) = keys_found
+            if f"{key}:".encode("ascii") in raw_content:
+                return cls.SEMANTIC_TYPE_KEYS[key]
+
+        try:
+            # Only ambiguous files need the decoded text
+            content = raw_content.decode("utf-8")
 
             # First attempt: Try to parse as valid YAML
             detected_type = cls._detect_from_parsed_yaml(content)
@@ -133,6 +192,18 @@ class FileTypeDetector:
             logger.debug(f"Error detecting semantic type for {file_path}: {e}")
             return None
 
+    @classmethod
+    def _read_and_scan_keys(cls, file_path: Path) -> Tuple[bytes, Set[str]]:
+        """
+        Read a file's raw bytes and collect the known root keys that appear in it.
+
+        Decoding is left to the caller.
+        """
+        with open(file_path, "rb") as f:
+            raw = f.read()
+
+        return raw, {match.group(1).decode("ascii") for match in cls._KEY_SCANNER.finditer(raw)}
+
     @classmethod
     def _detect_from_parsed_yaml(cls, content: str) -> Optional[str]:
         """
@@ -141,7 +212,7 @@ class FileTypeDetector:
         This works for files without Jinja templates.
         """
         try:
-            data = yaml.safe_load(content)
+            data = safe_load_yaml(content)
             if data:
                 # Check each known root key
                 for key, semantic_type in cls.SEMANTIC_TYPE_KEYS.items():
@@ -161,9 +232,13 @@ class FileTypeDetector:
         This fallback method works even when files contain Jinja templates
         that make them invalid YAML.
         """
-        # Check for each pattern in content
+        # Collect every pattern present in one scan, then resolve by pattern priority
+        found = {match.group(1) for match in cls._PATTERN_SCANNER.finditer(content)}
+        if not found:
+            return None
+
         for pattern, semantic_type in cls.SEMANTIC_TYPE_PATTERNS.items():
-            if pattern in content:
+            if pattern in found:
                 return semantic_type
 
         return None
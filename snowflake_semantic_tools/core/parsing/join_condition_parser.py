@@ -15,9 +15,11 @@ enabling it to work at any stage of the processing pipeline.
 """
 
 import re
+import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 
 class JoinType(Enum):
@@ -29,9 +31,13 @@ class JoinType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedCondition:
-    """Represents a parsed join condition."""
+    """Represents a parsed join condition.
+
+    Instances are immutable and hashable, so cached parse results can be shared and
+    used as cache keys. Use dataclasses.replace() to derive a modified copy.
+    """
 
     join_condition: str  # Original condition
     condition_type: JoinType
@@ -51,6 +57,14 @@ class ParsedCondition:
     right_unresolved_expression: str = ""
 
 
+# One side of a bare column-to-column condition: a column()/ref() template or a resolved
+# TABLE.COLUMN. Group names are prefixed per side via %-formatting ("{{" rules out str.format).
+_CONDITION_SIDE = (
+    r"(?:{{\s*(?:column|ref)\s*\(\s*['\"](?P<%(p)st>\w+)['\"]\s*,\s*['\"](?P<%(p)sc>\w+)['\"]\s*\)\s*}}"
+    r"|(?i:(?P<%(p)srt>[A-Z_][A-Z0-9_]*)\.(?P<%(p)src>[A-Z_][A-Z0-9_]*)))"
+)
+
+
 class JoinConditionParser:
     """
     Format-agnostic parser for join conditions.
@@ -72,15 +86,48 @@ class JoinConditionParser:
     # Pattern to extract {{ ref('table') }} templates (unified syntax for tables)
     REF_TABLE_PATTERN = re.compile(r"{{\s*ref\s*\(\s*['\"]([^'\"]+)['\"]\s*\)\s*}}")
 
+    # Single-pass pattern for both {{ column('table', 'column') }} and {{ ref('table', 'column') }}
+    COLUMN_OR_REF_TEMPLATE_PATTERN = re.compile(
+        r"{{\s*(?P<kind>column|ref)\s*\(\s*['\"](?P<table>[^'\"]+)['\"]\s*,\s*['\"](?P<column>[^'\"]+)['\"]\s*\)\s*}}"
+    )
+
     # Pattern to extract resolved SQL format: TABLE.COLUMN
     RESOLVED_COLUMN_PATTERN = re.compile(r"([A-Z_][A-Z0-9_]*)\.([A-Z_][A-Z0-9_]*)", re.IGNORECASE)
 
+    # Pattern to split range joins: <left> BETWEEN <start> AND <end> [EXCLUSIVE]
+    RANGE_SPLIT_PATTERN = re.compile(r"\s+BETWEEN\s+|\s+AND\s+", re.IGNORECASE)
+
+    # Pattern to strip the trailing EXCLUSIVE keyword from a range end expression
+    EXCLUSIVE_SUFFIX_PATTERN = re.compile(r"\s+EXCLUSIVE\s*$", re.IGNORECASE)
+
+    # Single-pass pattern for the common shape: one bare column reference per side around a
+    # comparison operator. Identifiers are restricted to word characters so neither side can
+    # contain operator text, "{{" or a second reference.
+    SIMPLE_CONDITION_PATTERN = re.compile(
+        r"\s*(?P<left>" + _CONDITION_SIDE % {"p": "l"} + r")"
+        r"\s*(?P<op>>=|<=|!=|<>|=|>|<)\s*"
+        r"(?P<right>" + _CONDITION_SIDE % {"p": "r"} + r")\s*"
+    )
+
+    # Join type for each supported operator; anything else is UNKNOWN
+    _OP_TO_JOIN: Dict[str, JoinType] = {
+        "=": JoinType.EQUALITY,
+        ">=": JoinType.ASOF,
+        "BETWEEN": JoinType.RANGE,
+    }
+
+    # Temporal comparison operators Snowflake semantic views reject (only >= is allowed for ASOF)
+    _REJECTED_OPS = frozenset({"<=", ">", "<"})
+
     @classmethod
+    @lru_cache(maxsize=4096)
     def parse(cls, condition: str) -> ParsedCondition:
         """
         Parse a join condition into its components.
 
         Automatically detects format (template vs resolved) and parses accordingly.
+        Results are memoized on the condition string, since the same conditions are
+        parsed repeatedly during validation, extraction and view generation.
 
         Args:
             condition: Join condition in either format:
@@ -90,6 +137,10 @@ class JoinConditionParser:
         Returns:
             ParsedCondition with all extracted components
         """
+        simple = cls._parse_simple(condition)
+        if simple is not None:
+            return simple
+
         # Detect operator and type
         operator = cls._detect_operator(condition)
         condition_type = cls._detect_join_type(operator)
@@ -100,40 +151,20 @@ class JoinConditionParser:
         # Detect format and extract table/column accordingly
         is_template_format = "{{" in condition
 
-        left_has_expression = False
-        right_has_expression = False
-        left_sql_expression = ""
-        right_sql_expression = ""
-        left_unresolved_expression = ""
-        right_unresolved_expression = ""
-
-        from snowflake_semantic_tools.core.generation.join_key_generator import detect_expression, has_wrapping_text
-
-        fallback_extractor = (
-            cls._extract_table_column_from_template if is_template_format else cls._extract_table_column_from_resolved
-        )
-
-        left_expr_info = detect_expression(left_expr.strip())
-        if left_expr_info:
-            left_table = left_expr_info["table"]
-            left_column = left_expr_info["column"]
-            left_has_expression = True
-            left_sql_expression = left_expr_info["sql_expression"]
-        else:
-            left_table, left_column = fallback_extractor(left_expr)
-            if has_wrapping_text(left_expr.strip()):
-                left_unresolved_expression = left_expr.strip()
-
-        right_expr_info = detect_expression(right_expr.strip())
-        if right_expr_info:
-            right_table = right_expr_info["table"]
-            right_column = right_expr_info["column"]
-            right_has_expression = True
-            right_sql_expression = right_expr_info["sql_expression"]
-        else:
-            right_table, right_column = fallback_extractor(right_expr)
-            if has_wrapping_text(right_expr.strip()):
-                right_unresolved_expression = right_expr.strip()
+        (
+            left_table,
+            left_column,
+            left_has_expression,
+            left_sql_expression,
+            left_unresolved_expression,
+        ) = cls._analyze_side(left_expr, is_template_format)
+        (
+            right_table,
+            right_column,
+            right_has_expression,
+            right_sql_expression,
+            right_unresolved_expression,
+        ) = cls._analyze_side(right_expr, is_template_format)
 
         # For BETWEEN range joins, extract the end column
         right_column_end = ""
@@ -144,17 +175,19 @@ class JoinConditionParser:
             else:
                 _, right_column_end = cls._extract_table_column_from_resolved(end_expr)
 
+        # Identifiers repeat heavily across a project's relationships; intern them so
+        # parsed conditions share one string object per table/column name
         return ParsedCondition(
             join_condition=condition,
             condition_type=condition_type,
             left_expression=left_expr.strip(),
             right_expression=right_expr.strip(),
-            left_table=left_table,
-            left_column=left_column,
-            right_table=right_table,
-            right_column=right_column,
+            left_table=sys.intern(left_table),
+            left_column=sys.intern(left_column),
+            right_table=sys.intern(right_table),
+            right_column=sys.intern(right_column),
             operator=operator,
-            right_column_end=right_column_end,
+            right_column_end=sys.intern(right_column_end),
             left_has_expression=left_has_expression,
             right_has_expression=right_has_expression,
             left_sql_expression=left_sql_expression,
@@ -163,10 +196,91 @@ class JoinConditionParser:
             right_unresolved_expression=right_unresolved_expression,
         )
 
+    @classmethod
+    def _parse_simple(cls, condition: str) -> Optional[ParsedCondition]:
+        """
+        Parse a bare column-to-column condition with a single regex match.
+
+        Returns None when the condition has any other shape (expressions, wrapping
+        text, mixed formats, BETWEEN), leaving it to the general path in parse().
+        """
+        match = cls.SIMPLE_CONDITION_PATTERN.fullmatch(condition)
+        if match is None:
+            return None
+
+        left_table = match.group("lt")
+        is_template_format = left_table is not None
+        if is_template_format:
+            right_table = match.group("rt")
+            if right_table is None:
+                return None
+            left_column, right_column = match.group("lc", "rc")
+        else:
+            right_table = match.group("rrt")
+            if right_table is None:
+                return None
+            left_table, left_column, right_column = match.group("lrt", "lrc", "rrc")
+
+        # The general path treats any BETWEEN keyword as a range join, even inside a name
+        if "BETWEEN" in condition.upper():
+            return None
+
+        operator = match.group("op")
+        # Bare columns have no range end or expressions, so those fields keep their defaults
+        return ParsedCondition(
+            join_condition=condition,
+            condition_type=cls._detect_join_type(operator),
+            left_expression=match.group("left"),
+            right_expression=match.group("right"),
+            left_table=sys.intern(left_table.upper()),
+            left_column=sys.intern(left_column.upper()),
+            right_table=sys.intern(right_table.upper()),
+            right_column=sys.intern(right_column.upper()),
+            operator=operator,
+        )
+
+    @classmethod
+    def _analyze_side(cls, side_expr: str, is_template_format: bool) -> Tuple[str, str, bool, str, str]:
+        """
+        Analyze one side of a join condition.
+
+        Returns:
+            Tuple of (table, column, has_expression, sql_expression, unresolved_expression)
+        """
+        side = side_expr.strip()
+
+        # Fast path: a bare resolved TABLE.COLUMN has no expression or wrapping text to detect
+        if not is_template_format:
+            bare_match = cls.RESOLVED_COLUMN_PATTERN.fullmatch(side)
+            if bare_match:
+                return bare_match.group(1).upper(), bare_match.group(2).upper(), False, "", ""
+
+        from snowflake_semantic_tools.core.generation.join_key_generator import detect_expression, has_wrapping_text
+
+        expr_info = detect_expression(side)
+        if expr_info:
+            return expr_info["table"], expr_info["column"], True, expr_info["sql_expression"], ""
+
+        if is_template_format:
+            table, column = cls._extract_table_column_from_template(side_expr)
+        else:
+            table, column = cls._extract_table_column_from_resolved(side_expr)
+        unresolved_expression = side if has_wrapping_text(side) else ""
+        return table, column, False, "", unresolved_expression
+
+    @classmethod
+    def parse_many(cls, conditions: Sequence[str]) -> Tuple[ParsedCondition, ...]:
+        """Parse a batch of join conditions into an immutable tuple.
+
+        Each condition goes through the memoized parse(), so conditions repeated
+        within a batch (or seen in earlier batches) are only parsed once.
+        """
+        return tuple(map(cls.parse, conditions))
+
     @classmethod
     def parse_multiple(cls, conditions: List[str]) -> List[ParsedCondition]:
-        """Parse multiple join conditions."""
-        return [cls.parse(cond) for cond in conditions]
+        """Parse multiple join conditions (list-returning form of parse_many)."""
+        return list(cls.parse_many(conditions))
 
     @classmethod
     def _detect_operator(cls, condition: str) -> str:
@@ -191,21 +305,14 @@ class JoinConditionParser:
         - >= : ASOF join (temporal relationship)
         - BETWEEN, <=, >, < : Not supported, will be rejected in validation
         """
-        if operator == "=":
-            return JoinType.EQUALITY
-        elif operator == ">=":
-            return JoinType.ASOF
-        elif operator == "BETWEEN":
-            return JoinType.RANGE
-        else:
-            return JoinType.UNKNOWN
+        return cls._OP_TO_JOIN.get(operator, JoinType.UNKNOWN)
 
     @classmethod
     def _split_on_operator(cls, condition: str, operator: str) -> Tuple[str, str]:
         """Split condition on operator, handling special cases."""
         if operator == "BETWEEN":
             # Handle BETWEEN x AND y [EXCLUSIVE]
-            parts = re.split(r"\s+BETWEEN\s+|\s+AND\s+", condition, flags=re.IGNORECASE)
+            parts = cls.RANGE_SPLIT_PATTERN.split(condition)
             if len(parts) >= 2:
                 return parts[0], parts[1]  # Return first two parts
         else:
@@ -220,9 +327,9 @@ class JoinConditionParser:
     @classmethod
     def _extract_range_end(cls, condition: str) -> Tuple[str, str]:
         """Extract the end column from a BETWEEN...AND...EXCLUSIVE condition."""
-        parts = re.split(r"\s+BETWEEN\s+|\s+AND\s+", condition, flags=re.IGNORECASE)
+        parts = cls.RANGE_SPLIT_PATTERN.split(condition)
         if len(parts) >= 3:
-            end_expr = re.sub(r"\s+EXCLUSIVE\s*$", "", parts[2], flags=re.IGNORECASE).strip()
+            end_expr = cls.EXCLUSIVE_SUFFIX_PATTERN.sub("", parts[2]).strip()
             return end_expr, end_expr
         return "", ""
 
@@ -237,18 +344,37 @@ class JoinConditionParser:
 
         Note: Uppercases table and column names to match Snowflake's identifier behavior.
         """
-        # Try unified ref() syntax first
-        match = cls.REF_TEMPLATE_PATTERN.search(expression)
-        if match:
-            return match.group(1).upper(), match.group(2).upper()
+        # One scan over both syntaxes; unified ref() still takes priority over legacy column()
+        column_match = None
+        for match in cls._iter_template_matches(expression):
+            if match.group("kind") == "ref":
+                return match.group("table").upper(), match.group("column").upper()
+            if column_match is None:
+                column_match = match
 
-        # Fall back to legacy column() syntax
-        match = cls.COLUMN_TEMPLATE_PATTERN.search(expression)
-        if match:
-            return match.group(1).upper(), match.group(2).upper()
+        if column_match:
+            return column_match.group("table").upper(), column_match.group("column").upper()
 
         return "", ""
 
+    @classmethod
+    def _iter_template_matches(cls, expression: str) -> Iterator["re.Match[str]"]:
+        """
+        Yield column()/ref() template matches in order of appearance.
+
+        Jumps between "{{" markers with str.find and only runs the pattern anchored
+        at each marker, instead of letting the regex engine probe every position.
+        """
+        pattern = cls.COLUMN_OR_REF_TEMPLATE_PATTERN
+        pos = expression.find("{{")
+        while pos != -1:
+            match = pattern.match(expression, pos)
+            if match:
+                yield match
+                pos = expression.find("{{", match.end())
+            else:
+                pos = expression.find("{{", pos + 1)
+
     @classmethod
     def _extract_table_column_from_resolved(cls, expression: str) -> Tuple[str, str]:
         """
@@ -270,59 +396,77 @@ class JoinConditionParser:
         """
         Validate a join condition (works with both template and resolved formats).
 
+        Like parse(), results for string conditions are memoized on the condition string.
+
         Returns:
             Tuple of (is_valid, error_message)
         """
         try:
-            parsed = cls.parse(condition)
-
-            # Check for unknown operators
-            if parsed.operator == "UNKNOWN":
-                return False, f"Unknown or unsupported operator in condition: {condition}"
-
-            # Reject unsupported temporal operators FIRST (before checking join type)
-            if parsed.operator in ["<=", ">", "<"]:
-                return False, (
-                    f"Operator '{parsed.operator}' is not supported for temporal relationships in Snowflake semantic views. "
-                    f"Only '>=' operator is supported for ASOF joins. "
-                    f"See: https://docs.snowflake.com/en/user-guide/views-semantic/sql"
-                )
+            if isinstance(condition, str):
+                return cls._validate_condition_cached(condition)
+            return cls._check_condition(condition)
+
+        except Exception as e:
+            return False, f"Error parsing condition: {str(e)}"
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _validate_condition_cached(cls, condition: str) -> Tuple[bool, str]:
+        """Memoized _check_condition for hashable string conditions."""
+        return cls._check_condition(condition)
+
+    @classmethod
+    def _check_condition(cls, condition: str) -> Tuple[bool, str]:
+        """Run the validation checks; parse errors propagate to validate_condition()."""
+        # Operator-level rejections only need the (cheap) operator scan, not a full parse
+        operator = cls._detect_operator(condition)
+
+        # Check for unknown operators
+        if operator == "UNKNOWN":
+            return False, f"Unknown or unsupported operator in condition: {condition}"
 
-            # BETWEEN operator is valid for range joins (preview feature)
-            if parsed.operator == "BETWEEN":
-                if not parsed.right_column_end:
-                    return False, (f"BETWEEN condition must include AND <end_column> EXCLUSIVE: {condition}")
-                if not parsed.left_table or not parsed.left_column:
-                    return False, f"Could not extract left table/column from: {parsed.left_expression}"
-                if not parsed.right_table or not parsed.right_column:
-                    return False, f"Could not extract right table/column from: {parsed.right_expression}"
-                return True, ""
-
-            # Check for unknown join type
-            if parsed.condition_type == JoinType.UNKNOWN:
-                return False, f"Unknown join type for operator '{parsed.operator}'"
-
-            # Check that we extracted tables and columns
+        # Reject unsupported temporal operators FIRST (before checking join type)
+        if operator in cls._REJECTED_OPS:
+            return False, (
+                f"Operator '{operator}' is not supported for temporal relationships in Snowflake semantic views. "
+                f"Only '>=' operator is supported for ASOF joins. "
+                f"See: https://docs.snowflake.com/en/user-guide/views-semantic/sql"
+            )
+
+        parsed = cls.parse(condition)
+
+        # BETWEEN operator is valid for range joins (preview feature)
+        if parsed.operator == "BETWEEN":
+            if not parsed.right_column_end:
+                return False, (f"BETWEEN condition must include AND <end_column> EXCLUSIVE: {condition}")
             if not parsed.left_table or not parsed.left_column:
                 return False, f"Could not extract left table/column from: {parsed.left_expression}"
-
             if not parsed.right_table or not parsed.right_column:
                 return False, f"Could not extract right table/column from: {parsed.right_expression}"
+            return True, ""
 
-            # Specific validations for ASOF joins
-            if parsed.condition_type == JoinType.ASOF:
-                if parsed.operator != ">=":
-                    return False, f"ASOF joins require >= operator, got: {parsed.operator}"
+        # Check for unknown join type
+        if parsed.condition_type is JoinType.UNKNOWN:
+            return False, f"Unknown join type for operator '{parsed.operator}'"
 
-            return True, ""
+        # Check that we extracted tables and columns
+        if not parsed.left_table or not parsed.left_column:
+            return False, f"Could not extract left table/column from: {parsed.left_expression}"
 
-        except Exception as e:
-            return False, f"Error parsing condition: {str(e)}"
+        if not parsed.right_table or not parsed.right_column:
+            return False, f"Could not extract right table/column from: {parsed.right_expression}"
+
+        # Specific validations for ASOF joins
+        if parsed.condition_type is JoinType.ASOF:
+            if parsed.operator != ">=":
+                return False, f"ASOF joins require >= operator, got: {parsed.operator}"
+
+        return True, ""
 
     @classmethod
     def generate_sql_references(
         cls,
-        parsed_conditions: List[ParsedCondition],
+        parsed_conditions: Sequence[ParsedCondition],
         left_table_alias: str,
         right_table_alias: str,
         join_key_overrides: Optional[Dict[str, str]] = None,
@@ -336,7 +480,7 @@ class JoinConditionParser:
         - Mixed: table(join_col, time_col) REFERENCES table(join_col, ASOF time_col)
 
         Args:
-            parsed_conditions: List of parsed conditions
+            parsed_conditions: Parsed conditions (a list, or the tuple returned by parse_many)
             left_table_alias: Alias for left table
             right_table_alias: Alias for right table
             join_key_overrides: Optional mapping of (TABLE.COLUMN) -> dimension name for
@@ -349,46 +493,44 @@ class JoinConditionParser:
         if not parsed_conditions:
             return ""
 
-        overrides = join_key_overrides or {}
+        overrides: Dict[str, str] = join_key_overrides or {}
 
-        def _resolve_col(table: str, column: str, side: str, cond: ParsedCondition) -> str:
-            has_expr = cond.left_has_expression if side == "left" else cond.right_has_expression
+        def _resolve_col(table: str, column: str, has_expr: bool) -> str:
             if has_expr:
                 key = f"{table.upper()}.{column.upper()}"
                 return overrides.get(key, column)
             return column
 
-        # Check if any condition is a range join
-        has_range = any(c.condition_type == JoinType.RANGE for c in parsed_conditions)
-
-        if has_range:
-            non_range = [c for c in parsed_conditions if c.condition_type != JoinType.RANGE]
-            if non_range:
+        # Single pass: build both column lists (so left/right positions stay aligned) and
+        # pick out the first range condition, which takes over the whole clause if present
+        range_cond: Optional[ParsedCondition] = None
+        left_cols: List[str] = []
+        right_cols: List[str] = []
+        for c in parsed_conditions:
+            if c.condition_type is JoinType.RANGE:
+                if range_cond is None:
+                    range_cond = c
+                continue
+            left_cols.append(_resolve_col(c.left_table, c.left_column, c.left_has_expression))
+            col = _resolve_col(c.right_table, c.right_column, c.right_has_expression)
+            right_cols.append(f"ASOF {col}" if c.condition_type is JoinType.ASOF else col)
+
+        if range_cond is not None:
+            if left_cols:
                 from snowflake_semantic_tools.shared import get_logger
 
                 _logger = get_logger("core.parsing.join_condition_parser")
                 _logger.warning(
-                    f"Range join has {len(non_range)} non-range condition(s) that will be ignored. "
+                    f"Range join has {len(left_cols)} non-range condition(s) that will be ignored. "
                     f"Snowflake range joins only support a single BETWEEN condition per relationship."
                 )
-            range_cond = next(c for c in parsed_conditions if c.condition_type == JoinType.RANGE)
-            left_col = _resolve_col(range_cond.left_table, range_cond.left_column, "left", range_cond)
+            left_col = _resolve_col(range_cond.left_table, range_cond.left_column, range_cond.left_has_expression)
             sql = (
                 f"{left_table_alias} ({left_col}) REFERENCES "
                 f"{right_table_alias} (BETWEEN {range_cond.right_column} AND {range_cond.right_column_end} EXCLUSIVE)"
             )
             return sql
 
-        left_cols = [_resolve_col(c.left_table, c.left_column, "left", c) for c in parsed_conditions]
-
-        right_cols = []
-        for c in parsed_conditions:
-            col = _resolve_col(c.right_table, c.right_column, "right", c)
-            if c.condition_type == JoinType.ASOF:
-                right_cols.append(f"ASOF {col}")
-            else:
-                right_cols.append(col)
-
         sql = f"{left_table_alias} ({', '.join(left_cols)}) REFERENCES {right_table_alias} ({', '.join(right_cols)})"
 
         return sql
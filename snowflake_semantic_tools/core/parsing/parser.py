@@ -9,6 +9,7 @@ semantic model YAML files.
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -18,9 +19,74 @@ from snowflake_semantic_tools.core.parsing.file_detector import FileTypeDetector
 from snowflake_semantic_tools.core.parsing.parsers import ErrorTracker, dbt_parser, format_yaml_error, semantic_parser
 from snowflake_semantic_tools.core.parsing.template_engine import HardcodedValueDetector, TemplateResolver
 from snowflake_semantic_tools.shared.utils import get_logger
+from snowflake_semantic_tools.shared.utils.file_utils import safe_load_yaml
 
 logger = get_logger("parser")
 
+# Line patterns for scanning custom_instructions in raw (unresolved) semantic view YAML
+_VIEW_NAME_PATTERN = re.compile(r"^(\s*)-\s+name:\s*(.+)$")
+_VIEW_START_PATTERN = re.compile(r"^\s*-\s+name:")
+_CUSTOM_INSTRUCTIONS_KEY_PATTERN = re.compile(r"^(\s+)custom_instructions:\s*$")
+_CUSTOM_INSTRUCTION_TEMPLATE_PATTERN = re.compile(r'\{\{\s*custom_instructions\([\'"]([^\'")]+)[\'"]\)\s*\}\}')
+_LIST_ITEM_PATTERN = re.compile(r"^\s+-\s+")
+_NESTED_KEY_PATTERN = re.compile(r"^\s+\w+:")
+
+# Template patterns for catalog collection and derived-metric resolution
+_TEMPLATE_EXPRESSION_PATTERN = re.compile(r"\{\{[^}]+\}\}")
+_TEMPLATE_PLACEHOLDER_PATTERN = re.compile(r"__TEMPLATE_\d+__")
+_COLLECTION_TEMPLATE_PATTERNS = (
+    (re.compile(r"\{\{\s*table\([^)]+\)\s*\}\}"), "TEMP_TABLE"),
+    (re.compile(r"\{\{\s*column\([^)]+\)\s*\}\}"), "TEMP_COLUMN"),
+    (re.compile(r"\{\{\s*metric\([^)]+\)\s*\}\}"), "TEMP_METRIC"),
+    (re.compile(r"\{\{\s*custom_instructions\([^)]+\)\s*\}\}"), "TEMP_INSTRUCTION"),
+)
+_QUOTED_JINJA_VALUE_PATTERN = re.compile(r""":\s*["'].*\{\{.*\}\}.*["']""")
+_QUOTED_JINJA_ITEM_PATTERN = re.compile(r"""-\s*["'].*\{\{.*\}\}.*["']""")
+_JINJA_EXPRESSION_PATTERN = re.compile(r"\{\{.*?\}\}")
+_METRIC_TEMPLATE_PATTERN = re.compile(r'\{\{\s*metric\([\'"]([^\'")]+)[\'"]\)\s*\}\}')
+_REF_CALL_PATTERN = re.compile(r"ref\(['\"](\w+)['\"]\)")
+
+
+@lru_cache(maxsize=None)
+def _default_file_detector() -> FileTypeDetector:
+    """Process-wide file type detector; detection is stateless, so all parsers share one."""
+    return FileTypeDetector()
+
+
+@lru_cache(maxsize=32)
+def _load_metrics_with_neutralized_jinja(raw_content: str) -> Any:
+    """
+    Parse the metrics of a raw metrics file for derived-metric resolution.
+
+    Unquoted Jinja (like table refs) is neutralized for safe YAML parsing, while quoted
+    Jinja (like metric exprs) is preserved intact. Keyed on the raw content, so a file
+    with several derived metrics is parsed once. Callers must treat the result as read-only.
+
+    Returns:
+        The file's metrics list, or an empty tuple if the content is not valid YAML
+    """
+    neutralized = "\n".join(
+        (
+            line
+            if _QUOTED_JINJA_VALUE_PATTERN.search(line) or _QUOTED_JINJA_ITEM_PATTERN.search(line)
+            else _JINJA_EXPRESSION_PATTERN.sub("PLACEHOLDER", line)
+        )
+        for line in raw_content.split("\n")
+    )
+
+    try:
+        data = safe_load_yaml(neutralized)
+    except yaml.YAMLError:
+        return ()
+
+    if isinstance(data, dict):
+        for key in ("metrics", "snowflake_metrics"):
+            if key in data:
+                return data[key]
+    elif isinstance(data, list):
+        return data
+    return ()
+
 
 class ParsingCriticalError(Exception):
     """
@@ -56,6 +122,23 @@ class Parser:
     enabling metrics to reference other metrics and proper validation of all references.
     """
 
+    # Core state lives in fixed slots. "__dict__" is kept so instances can still be patched
+    # per attribute (e.g. mocking parse_all_files in tests); it is only allocated on first use.
+    __slots__ = (
+        "__dict__",
+        "error_tracker",
+        "_file_detector",
+        "enable_template_resolution",
+        "target_database",
+        "manifest_parser",
+        "template_resolver",
+        "hardcoded_detector",
+        "dbt_catalog",
+        "metrics_catalog",
+        "custom_instructions_catalog",
+        "parsed_files",
+    )
+
     def __init__(self, enable_template_resolution: bool = True, target_database: Optional[str] = None):
         """
         Initialize the parser.
@@ -65,7 +148,7 @@ class Parser:
             target_database: Optional target database to use for table references instead of SST metadata
         """
         self.error_tracker = ErrorTracker()
-        self.file_detector = FileTypeDetector()
+        self._file_detector: Optional[FileTypeDetector] = None  # Per-instance override, if any
         self.enable_template_resolution = enable_template_resolution
         self.target_database = target_database
         self.manifest_parser = None  # NEW: Can be set by services for auto-detection
@@ -82,6 +165,21 @@ class Parser:
         # Track processed files
         self.parsed_files: List[str] = []
 
+    @property
+    def file_detector(self) -> FileTypeDetector:
+        """File type detector: an assigned override, or the shared default instance."""
+        if self._file_detector is None:
+            return _default_file_detector()
+        return self._file_detector
+
+    @file_detector.setter
+    def file_detector(self, detector: FileTypeDetector) -> None:
+        self._file_detector = detector
+
+    @file_detector.deleter
+    def file_detector(self) -> None:
+        self._file_detector = None
+
     def parse_all_files(self, dbt_files: List[Path], semantic_files: List[Path]) -> Dict[str, Any]:
         """
         Parse all provided files with template resolution.
@@ -155,7 +253,7 @@ class Parser:
         for file_path in dbt_files:
             try:
                 content = file_path.read_text(encoding="utf-8")
-                data = yaml.safe_load(content)
+                data = safe_load_yaml(content)
 
                 if data and "models" in data:
                     for model in data["models"]:
@@ -194,8 +292,6 @@ class Parser:
             # The challenge is that {{ }} breaks YAML parsing
             # So we'll use a mapping approach to restore templates after parsing
 
-            import re
-
             # Create a mapping of placeholders to original templates
             template_map = {}
             counter = 0
@@ -208,10 +304,15 @@ class Parser:
                 return placeholder
 
             # Replace templates with unique placeholders
-            safe_content = re.sub(r"\{\{[^}]+\}\}", replace_and_store, content)
+            safe_content = _TEMPLATE_EXPRESSION_PATTERN.sub(replace_and_store, content)
+
+            def restore_templates(text: str) -> str:
+                if not template_map:
+                    return text
+                return _TEMPLATE_PLACEHOLDER_PATTERN.sub(lambda m: template_map.get(m.group(0), m.group(0)), text)
 
             # Now parse the safe YAML
-            data = yaml.safe_load(safe_content)
+            data = safe_load_yaml(safe_content)
 
             if data and "snowflake_metrics" in data:
                 metrics = data["snowflake_metrics"]
@@ -219,21 +320,12 @@ class Parser:
                     # Restore templates in each metric
                     for metric in metrics:
                         if "expr" in metric:
-                            expr = str(metric["expr"])
                             # Restore all templates in the expression
-                            for placeholder, template in template_map.items():
-                                expr = expr.replace(placeholder, template)
-                            metric["expr"] = expr
+                            metric["expr"] = restore_templates(str(metric["expr"]))
 
                         # Also restore templates in other fields if needed
                         if "tables" in metric and isinstance(metric["tables"], list):
-                            restored_tables = []
-                            for table in metric["tables"]:
-                                table_str = str(table)
-                                for placeholder, template in template_map.items():
-                                    table_str = table_str.replace(placeholder, template)
-                                restored_tables.append(table_str)
-                            metric["tables"] = restored_tables
+                            metric["tables"] = [restore_templates(str(table)) for table in metric["tables"]]
 
                     # Add all metrics to catalog
                     self.metrics_catalog.extend(metrics)
@@ -258,7 +350,7 @@ class Parser:
 
             # Temporarily replace templates for parsing
             temp_content = self._replace_templates_for_collection(content)
-            data = yaml.safe_load(temp_content)
+            data = safe_load_yaml(temp_content)
 
             if data and "snowflake_custom_instructions" in data:
                 instructions = data["snowflake_custom_instructions"]
@@ -300,10 +392,8 @@ class Parser:
     def _replace_templates_for_collection(self, content: str) -> str:
         """Temporarily replace templates to allow YAML parsing."""
         # Replace templates with placeholders
-        content = re.sub(r"\{\{\s*table\([^)]+\)\s*\}\}", "TEMP_TABLE", content)
-        content = re.sub(r"\{\{\s*column\([^)]+\)\s*\}\}", "TEMP_COLUMN", content)
-        content = re.sub(r"\{\{\s*metric\([^)]+\)\s*\}\}", "TEMP_METRIC", content)
-        content = re.sub(r"\{\{\s*custom_instructions\([^)]+\)\s*\}\}", "TEMP_INSTRUCTION", content)
+        for pattern, placeholder in _COLLECTION_TEMPLATE_PATTERNS:
+            content = pattern.sub(placeholder, content)
         return content
 
     def _resolve_catalog_templates(self):
@@ -460,36 +550,7 @@ class Parser:
         (like table refs) is neutralized for safe YAML parsing, while quoted Jinja
         (like metric exprs) is preserved intact. No regex fallback needed.
         """
-        import re as _re
-
-        import yaml
-
-        def _neutralize_unquoted_jinja(content: str) -> str:
-            result = []
-            for line in content.split("\n"):
-                if _re.search(r""":\s*["'].*\{\{.*\}\}.*["']""", line) or _re.search(
-                    r"""-\s*["'].*\{\{.*\}\}.*["']""", line
-                ):
-                    result.append(line)
-                else:
-                    result.append(_re.sub(r"\{\{.*?\}\}", "PLACEHOLDER", line))
-            return "\n".join(result)
-
-        neutralized = _neutralize_unquoted_jinja(raw_content)
-
-        try:
-            data = yaml.safe_load(neutralized)
-        except yaml.YAMLError:
-            return ""
-
-        metrics_list = []
-        if isinstance(data, dict):
-            for key in ("metrics", "snowflake_metrics"):
-                if key in data:
-                    metrics_list = data[key]
-                    break
-        elif isinstance(data, list):
-            metrics_list = data
+        metrics_list = _load_metrics_with_neutralized_jinja(raw_content)
 
         raw_expr = ""
         for m in metrics_list:
@@ -500,8 +561,6 @@ class Parser:
         if not raw_expr or not isinstance(raw_expr, str):
             return ""
 
-        metric_ref_pattern = r'\{\{\s*metric\([\'"]([^\'")]+)[\'"]\)\s*\}\}'
-
         def replace_with_qualified_name(m):
             ref_name = m.group(1).upper()
             for catalog_metric in self.metrics_catalog:
@@ -509,47 +568,42 @@ class Parser:
                     tables = catalog_metric.get("tables", [])
                     if tables:
                         table_ref = str(tables[0])
-                        table_match = _re.search(r"ref\(['\"](\w+)['\"]\)", table_ref)
+                        table_match = _REF_CALL_PATTERN.search(table_ref)
                         if table_match:
                             return f"{table_match.group(1).upper()}.{ref_name}"
                         return f"{table_ref.upper()}.{ref_name}"
                     return ref_name
             return ref_name
 
-        resolved = _re.sub(metric_ref_pattern, replace_with_qualified_name, raw_expr)
+        resolved = _METRIC_TEMPLATE_PATTERN.sub(replace_with_qualified_name, raw_expr)
         return resolved
 
     def _extract_custom_instruction_names_from_views(self, content: str) -> Dict[str, List[str]]:
         """
         Extract custom instruction names from semantic views before template resolution.
 
-        Uses a clean regex-based approach that mirrors the metrics collection pattern:
+        The raw content still holds unquoted Jinja, which is not valid YAML, so this
+        scans lines with precompiled patterns instead of loading the document:
         - Finds view names and their custom_instructions sections
         - Extracts instruction names only from list items under custom_instructions
         - Handles nested structures by tracking indentation levels
 
         Returns a map of view name -> list of instruction names.
         """
-        import re
-
         instruction_names_map: Dict[str, List[str]] = {}
 
-        # Pattern to match view name (handles various indentation levels)
-        view_name_pattern = r"^(\s*)-\s+name:\s*(.+)$"
-        # Pattern to match custom_instructions key
-        custom_instr_key_pattern = r"^(\s+)custom_instructions:\s*$"
-        # Pattern to match custom_instructions template in list items
-        instruction_pattern = r'\{\{\s*custom_instructions\([\'"]([^\'")]+)[\'"]\)\s*\}\}'
+        # Most files reference no instructions; skip the line scan entirely for them
+        if "custom_instructions" not in content:
+            return instruction_names_map
 
-        lines = content.split("\n")
         current_view_name: Optional[str] = None
         in_custom_instructions = False
         view_indent_level = 0
         custom_instr_indent_level = 0
 
-        for line in lines:
+        for line in content.split("\n"):
             # Check if this line starts a new view
-            view_match = re.match(view_name_pattern, line)
+            view_match = _VIEW_NAME_PATTERN.match(line)
             if view_match:
                 current_view_name = view_match.group(2).strip()
                 view_indent_level = len(view_match.group(1))
@@ -558,7 +612,7 @@ class Parser:
 
             # Check if we're entering custom_instructions section
             if current_view_name:
-                custom_instr_match = re.match(custom_instr_key_pattern, line)
+                custom_instr_match = _CUSTOM_INSTRUCTIONS_KEY_PATTERN.match(line)
                 if custom_instr_match:
                     custom_instr_indent_level = len(custom_instr_match.group(1))
                     in_custom_instructions = True
@@ -568,8 +622,8 @@ class Parser:
                 if in_custom_instructions:
                     # Only match templates in list items (lines starting with -)
                     # This avoids matching templates in descriptions or other nested fields
-                    if re.match(r"^\s+-\s+", line):
-                        match = re.search(instruction_pattern, line)
+                    if _LIST_ITEM_PATTERN.match(line):
+                        match = _CUSTOM_INSTRUCTION_TEMPLATE_PATTERN.search(line)
                         if match:
                             instruction_name = match.group(1).upper()
                             # Initialize list only when we find the first instruction
@@ -580,10 +634,10 @@ class Parser:
                     elif line.strip():
                         line_indent = len(line) - len(line.lstrip())
                         # If we hit a key at same or less indentation than custom_instructions, we've left it
-                        if re.match(r"^\s+\w+:", line) and line_indent <= custom_instr_indent_level:
+                        if _NESTED_KEY_PATTERN.match(line) and line_indent <= custom_instr_indent_level:
                             in_custom_instructions = False
                         # If we hit a new view (at view indent level), reset
-                        elif re.match(r"^\s*-\s+name:", line) and line_indent <= view_indent_level:
+                        elif _VIEW_START_PATTERN.match(line) and line_indent <= view_indent_level:
                             in_custom_instructions = False
 
         return instruction_names_map
@@ -597,7 +651,7 @@ class Parser:
     ) -> Optional[List[Dict]]:
         """Parse semantic content based on type."""
         try:
-            data = yaml.safe_load(content)
+            data = safe_load_yaml(content)
 
             # Route to appropriate parser
             if semantic_type == "metrics":
@@ -6,6 +6,7 @@ Pure utility functions for extracting structured data from YAML content.
 These functions handle the transformation from raw YAML dictionaries to our target data structures.
 """
 
+import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -17,6 +18,9 @@ logger = get_logger("yaml_parser.data_extractors")
 # Track which deprecation warnings have been emitted to avoid duplicates
 _deprecation_warnings_emitted: set = set()
 
+# meta.sst keys that dbt's manifest owns; set in YAML they are ignored with a warning
+_MANIFEST_OWNED_SST_KEYS = ("database", "schema")
+
 
 def get_sst_meta(
     node: Dict[str, Any],
@@ -40,22 +44,24 @@ def get_sst_meta(
     Returns:
         SST metadata dictionary (may be empty)
     """
-    # Try new location first (config.meta.sst) - dbt Fusion compatible
-    config = node.get("config", {})
-    config_meta = config.get("meta", {}) if isinstance(config, dict) else {}
-    if "sst" in config_meta:
-        sst = config_meta.get("sst")
-        return sst if isinstance(sst, dict) else {}
+    # Try new location first (config.meta.sst) - dbt Fusion compatible.
+    # Missing keys come back as None rather than a throwaway {} default; this runs for every model and column.
+    config = node.get("config")
+    if isinstance(config, dict):
+        config_meta = config.get("meta")
+        if isinstance(config_meta, dict) and "sst" in config_meta:
+            sst = config_meta["sst"]
+            return sst if isinstance(sst, dict) else {}
 
     # Fall back to old location (meta.sst)
-    meta = node.get("meta", {})
+    meta = node.get("meta")
     if not isinstance(meta, dict):
         return {}
 
-    sst_meta = meta.get("sst", {})
+    sst_meta = meta.get("sst")
 
     # Emit deprecation warning if using old pattern (only if found and warning enabled)
-    if sst_meta and emit_warning:
+    if emit_warning and sst_meta:
         _emit_deprecation_warning(node_type, node_name)
 
     return sst_meta if isinstance(sst_meta, dict) else {}
@@ -136,43 +142,41 @@ def extract_table_info(
         # The --database flag (target_database) is ONLY for defer mechanism (environment override)
         # YAML values are COMPLETELY IGNORED
 
-        # Warn if database/schema are in YAML (they will be ignored)
-        if sst_meta.get("database"):
-            logger.warning(
-                f"Model '{name}' has database in meta.sst - this is IGNORED. Remove it. Database comes from manifest.json only."
-            )
-        if sst_meta.get("schema"):
-            logger.warning(
-                f"Model '{name}' has schema in meta.sst - this is IGNORED. Remove it. Schema comes from manifest.json only."
-            )
+        # Warn if database/schema are in YAML (they will be ignored); skipped outright when WARNING is filtered
+        if not sst_meta.keys().isdisjoint(_MANIFEST_OWNED_SST_KEYS) and logger.isEnabledFor(logging.WARNING):
+            for key in _MANIFEST_OWNED_SST_KEYS:
+                if sst_meta.get(key):
+                    logger.warning(
+                        f"Model '{name}' has {key} in meta.sst - this is IGNORED. Remove it. "
+                        f"{key.capitalize()} comes from manifest.json only.",
+                        extra={"model": name, "ignored_field": key, "source_file": str(file_path)},
+                    )
+
+        # Look the model up in the manifest once; it supplies both database and schema
+        location = manifest_parser.get_location(name) if manifest_parser and manifest_parser.manifest else None
 
         if target_database:
             # Defer mechanism: override database for environment deployment
             database = target_database.upper()
             logger.debug(f"Using target_database '{target_database}' (defer mechanism) for table '{name}'")
-        elif manifest_parser and manifest_parser.manifest:
+        elif location:
             # Normal operation: read from manifest
-            location = manifest_parser.get_location(name)
-            if location:
-                database = location["database"]
-                logger.debug(f"Database from manifest for '{name}': {database}")
-            else:
-                database = ""
+            database = location["database"]
+            logger.debug(f"Database from manifest for '{name}': {database}")
         else:
             database = ""
 
         # Schema ALWAYS comes from manifest (no override mechanism)
         schema = ""
-        if manifest_parser and manifest_parser.manifest:
-            location = manifest_parser.get_location(name)
-            if location:
-                schema = location["schema"].upper()
-                logger.debug(f"Schema from manifest for '{name}': {schema}")
+        if location:
+            schema = location["schema"].upper()
+            logger.debug(f"Schema from manifest for '{name}': {schema}")
 
         # Build table record with uppercase formatting for specified fields
         # Write BOTH new and old field names for database backward compatibility
+        table_name = sst_meta.get("table", name)
         table_record = {
-            "table_name": sst_meta.get("table", name).upper() if sst_meta.get("table", name) else name.upper(),
+            "table_name": table_name.upper() if table_name else name.upper(),
             "database": database,
             "schema": schema.upper() if schema else "",
             "description": description,
@@ -29,6 +29,7 @@ from snowflake_semantic_tools.core.parsing.parsers.data_extractors import (
 )
 from snowflake_semantic_tools.core.parsing.parsers.error_handler import ErrorTracker, format_yaml_error
 from snowflake_semantic_tools.shared import get_logger
+from snowflake_semantic_tools.shared.utils.file_utils import safe_load_yaml
 
 logger = get_logger("yaml_parser.dbt_parser")
 
@@ -70,7 +71,7 @@ def parse_dbt_yaml_file(
     try:
         # Load YAML content
         with open(file_path, "r", encoding="utf-8") as f:
-            yaml_content = yaml.safe_load(f)
+            yaml_content = safe_load_yaml(f)
 
         if not yaml_content:
             logger.debug(f"Empty YAML file: {file_path}")
@@ -133,7 +134,6 @@ def parse_single_model(
     result = get_empty_result()
 
     model_name = model.get("name", "unknown")
-    sst_meta = get_sst_meta(model, node_type="model", node_name=model_name)
 
     logger.debug(f"Processing model '{model_name}'")
 
@@ -16,6 +16,42 @@ from snowflake_semantic_tools.shared import get_logger
 
 logger = get_logger("yaml_parser.error_handler")
 
+# PyYAML message fragment -> error type label, checked in order
+_YAML_ERROR_TYPES = (
+    ("while parsing a block collection", "Block collection parsing error"),
+    ("while scanning a simple key", "Simple key scanning error"),
+    ("mapping values are not allowed here", "Invalid mapping values"),
+    ("while parsing a block mapping", "Block mapping parsing error"),
+    ("could not find expected", "Missing expected character"),
+)
+
+# Lowercased message fragments -> suggestion appended to the formatted error, checked in order
+_YAML_ERROR_SUGGESTIONS = (
+    (
+        ("mapping values are not allowed",),
+        "\n\n  Suggestion: Your string contains an unquoted colon (:)."
+        "\n  Use multiline syntax for descriptions with special characters:"
+        "\n"
+        "\n    description: |-"
+        "\n      Your description with colons: like this"
+        "\n"
+        "\n  Or quote the string:"
+        "\n"
+        '\n    description: "Your description with colons: like this"',
+    ),
+    (
+        ("unhashable key", "found undefined"),
+        "\n\n  Suggestion: Template syntax {{ }} may be breaking YAML parsing."
+        "\n  Ensure templates are on their own line in list items:"
+        "\n"
+        "\n    tables:"
+        "\n      - {{ ref('my_table') }}  # or {{ table('my_table') }} (legacy)",
+    ),
+)
+
+_ERROR_FILE_PATTERN = re.compile(r"in (.+?):")
+_ERROR_LINE_PATTERN = re.compile(r"line (\d+)")
+
 
 class ErrorTracker:
     """Tracks and manages parsing errors throughout the YAML parsing process."""
@@ -71,18 +107,10 @@ def format_yaml_error(yaml_error: yaml.YAMLError, file_path: Path) -> str:
             line_num = str(yaml_error.problem_mark.line + 1)
 
         # Extract error type from the error message
-        if "while parsing a block collection" in error_str:
-            error_type = "Block collection parsing error"
-        elif "while scanning a simple key" in error_str:
-            error_type = "Simple key scanning error"
-        elif "mapping values are not allowed here" in error_str:
-            error_type = "Invalid mapping values"
-        elif "while parsing a block mapping" in error_str:
-            error_type = "Block mapping parsing error"
-        elif "could not find expected" in error_str:
-            error_type = "Missing expected character"
-        else:
-            error_type = "YAML syntax error"
+        error_type = next(
+            (label for fragment, label in _YAML_ERROR_TYPES if fragment in error_str),
+            "YAML syntax error",
+        )
 
         # Add helpful suggestion based on error type
         suggestion = _get_yaml_error_suggestion(error_str)
@@ -106,27 +134,9 @@ def _get_yaml_error_suggestion(error_str: str) -> str:
     """
     error_lower = error_str.lower()
 
-    if "mapping values are not allowed" in error_lower:
-        return (
-            "\n\n  Suggestion: Your string contains an unquoted colon (:)."
-            "\n  Use multiline syntax for descriptions with special characters:"
-            "\n"
-            "\n    description: |-"
-            "\n      Your description with colons: like this"
-            "\n"
-            "\n  Or quote the string:"
-            "\n"
-            '\n    description: "Your description with colons: like this"'
-        )
-
-    if "unhashable key" in error_lower or "found undefined" in error_lower:
-        return (
-            "\n\n  Suggestion: Template syntax {{ }} may be breaking YAML parsing."
-            "\n  Ensure templates are on their own line in list items:"
-            "\n"
-            "\n    tables:"
-            "\n      - {{ ref('my_table') }}  # or {{ table('my_table') }} (legacy)"
-        )
+    for fragments, suggestion in _YAML_ERROR_SUGGESTIONS:
+        if any(fragment in error_lower for fragment in fragments):
+            return suggestion
 
     return ""
 
@@ -142,11 +152,11 @@ def parse_error_message(error_msg: str) -> Dict[str, str]:
         Dictionary with structured error information
     """
     # Extract file path
-    file_match = re.search(r"in (.+?):", error_msg)
+    file_match = _ERROR_FILE_PATTERN.search(error_msg)
     file_path = file_match.group(1) if file_match else "Unknown"
 
     # Extract line number
-    line_match = re.search(r"line (\d+)", error_msg)
+    line_match = _ERROR_LINE_PATTERN.search(error_msg)
     line_number = line_match.group(1) if line_match else "Unknown"
 
     # Extract error type - check for our formatted error types first
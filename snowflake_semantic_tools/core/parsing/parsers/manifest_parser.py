@@ -18,16 +18,125 @@ Key Benefits:
 """
 
 import json
+import logging
 import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from itertools import islice
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from snowflake_semantic_tools.shared.utils import get_logger
 
+try:
+    # Optional: orjson decodes large manifests several times faster than the stdlib.
+    # Its JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+_NS_PER_HOUR = 3_600_000_000_000
+
+
+# Latest location index per resolved manifest path, tagged with the file's (mtime_ns, size) signature
+_LOCATION_INDEX_CACHE: Dict[str, Tuple[Tuple[int, int], Tuple[Dict[str, Dict[str, str]], int, Dict[str, int]]]] = {}
+
+
+def _read_manifest(path: Path) -> Tuple[Dict[str, Any], Dict[str, Dict[str, str]], int, Dict[str, int]]:
+    """
+    Decode a manifest file and index its models.
+
+    Every call decodes the file into a manifest owned by the caller. Only the model
+    location index is cached, one entry per resolved path, and it is replaced when the file's
+    mtime or size changes. Callers get their own copy of the index.
+
+    Returns:
+        Tuple of (manifest, model_locations, model node count, located models per database)
+    """
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    manifest = _json_loads(path.read_bytes())
+    if "nodes" not in manifest:
+        return manifest, {}, 0, {}
+
+    key = str(path.resolve())
+    cached = _LOCATION_INDEX_CACHE.get(key)
+    if cached is None or cached[0] != signature:
+        cached = (signature, _build_location_cache(manifest["nodes"]))
+        _LOCATION_INDEX_CACHE[key] = cached
+
+    model_locations, model_count, models_by_database = cached[1]
+    return (
+        manifest,
+        {model_name: dict(location) for model_name, location in model_locations.items()},
+        model_count,
+        dict(models_by_database),
+    )
+
+
+def _build_location_cache(nodes: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, str]], int, Dict[str, int]]:
+    """
+    Build cache of model locations from manifest nodes.
+
+    Extracts database, schema, alias, and path information for all models.
+    Only processes 'model' resource types (not tests, seeds, snapshots, etc.)
+    The summary counts are folded into the same pass over the nodes.
+
+    Returns:
+        Tuple of (model_locations, model node count, located models per database)
+    """
+    model_locations: Dict[str, Dict[str, str]] = {}
+    model_count = 0
+    models_by_database: Dict[str, int] = {}
+    # Thousands of models share a handful of databases/schemas; keep one string object per value
+    shared_names: Dict[str, str] = {}
+    log_debug = logger.isEnabledFor(logging.DEBUG)
+
+    for node_id, node in nodes.items():
+        if node_id.startswith("model."):
+            model_count += 1
+
+        # Only process models (skip tests, seeds, snapshots, etc.)
+        get = node.get
+        if get("resource_type") != "model":
+            continue
+
+        model_name = get("name")
+        if not model_name:
+            continue
+
+        # Extract location information
+        # Note: database and schema are RESOLVED by dbt (no more Jinja)
+        database = get("database")
+        schema = get("schema")
+
+        # Validate that database and schema are non-empty before uppercasing
+        if not database or not schema:
+            logger.warning(f"Model '{model_name}' has empty database or schema in manifest. Skipping.")
+            continue
+
+        database = database.upper()
+        database = shared_names.setdefault(database, database)
+        schema = schema.upper()
+        schema = shared_names.setdefault(schema, schema)
+        models_by_database[database] = models_by_database.get(database, 0) + 1
+        model_locations[model_name] = {
+            "database": database,
+            "schema": schema,
+            "alias": get("alias", model_name),
+            "relation_name": get("relation_name", ""),
+            "original_file_path": get("original_file_path", ""),
+            "unique_id": node_id,
+        }
+
+        if log_debug:
+            logger.debug(f"Cached location for {model_name}: {database}.{schema}")
+
+    return model_locations, model_count, models_by_database
+
 
 # =============================================================================
 # Data Classes
@@ -105,9 +214,40 @@ class ManifestParser:
                           - ./target_{env}/manifest.json
         """
         self.manifest_path = manifest_path
-        self.manifest = None
+        self.manifest: Optional[Dict[str, Any]] = None
         self.model_locations = {}  # Cache: model_name -> location dict
         self._search_paths = []
+        # (indexed model_locations, path parts -> (position, model_name, location))
+        self._path_index: Optional[
+            Tuple[Dict[str, Dict[str, str]], Dict[Tuple[str, ...], Tuple[int, str, Dict[str, str]]]]
+        ] = None
+        # (model node count, models per database), folded in by load()
+        self._model_counts: Optional[Tuple[int, Dict[str, int]]] = None
+        # (indexed manifest, model_name -> checksum of its first model node)
+        self._checksum_index: Optional[Tuple[Optional[Dict[str, Any]], Dict[str, Optional[str]]]] = None
+
+    @classmethod
+    def from_dict(cls, manifest: Dict[str, Any], manifest_path: Optional[Path] = None) -> "ManifestParser":
+        """
+        Create a parser from an already-decoded manifest, skipping the file read.
+
+        The dict is indexed as load() would index it and is shared, not copied,
+        so callers must treat it as read-only.
+
+        Args:
+            manifest: Decoded manifest.json content
+            manifest_path: Optional path recorded as the manifest's origin
+
+        Returns:
+            ManifestParser ready for lookups
+        """
+        parser = cls(manifest_path=manifest_path)
+        parser.manifest = manifest
+        if "nodes" in manifest:
+            model_locations, model_count, models_by_database = _build_location_cache(manifest["nodes"])
+            parser.model_locations = model_locations
+            parser._model_counts = (model_count, models_by_database)
+        return parser
 
     def _find_manifest(self) -> Optional[Path]:
         """
@@ -158,8 +298,8 @@ class ManifestParser:
             return False
 
         try:
-            with open(manifest_path, "r", encoding="utf-8") as f:
-                self.manifest = json.load(f)
+            # Repeat loads of an unchanged manifest reuse the location index
+            self.manifest, model_locations, model_count, models_by_database = _read_manifest(manifest_path)
 
             self.manifest_path = manifest_path
             logger.info(f"Loaded manifest from: {manifest_path}")
@@ -169,11 +309,10 @@ class ManifestParser:
                 logger.warning(f"Manifest missing 'nodes' key: {manifest_path}")
                 return False
 
-            # Build location cache
-            self._build_location_cache()
+            self.model_locations = model_locations
+            self._model_counts = (model_count, models_by_database)
 
             # Log summary
-            model_count = len([k for k in self.manifest["nodes"].keys() if k.startswith("model.")])
             logger.info(f"Parsed {model_count} models from manifest")
 
             return True
@@ -188,53 +327,6 @@ class ManifestParser:
             logger.error(f"Unexpected error loading manifest: {e}")
             return False
 
-    def _build_location_cache(self):
-        """
-        Build cache of model locations from manifest nodes.
-
-        Extracts database, schema, alias, and path information for all models.
-        Only processes 'model' resource types (not tests, seeds, snapshots, etc.)
-        """
-        if not self.manifest or "nodes" not in self.manifest:
-            return
-
-        for node_id, node in self.manifest["nodes"].items():
-            # Only process models (skip tests, seeds, snapshots, etc.)
-            if node.get("resource_type") != "model":
-                continue
-
-            model_name = node.get("name")
-            if not model_name:
-                continue
-
-            # Extract location information
-            # Note: database and schema are RESOLVED by dbt (no more Jinja)
-            database = node.get("database", "")
-            schema = node.get("schema", "")
-
-            # Validate that database and schema are non-empty before uppercasing
-            if not database or not schema:
-                logger.warning(f"Model '{model_name}' has empty database or schema in manifest. Skipping.")
-                continue
-
-            database = database.upper()
-            schema = schema.upper()
-            alias = node.get("alias", model_name)
-            relation_name = node.get("relation_name", "")
-            original_file_path = node.get("original_file_path", "")
-
-            # Store in cache
-            self.model_locations[model_name] = {
-                "database": database,
-                "schema": schema,
-                "alias": alias,
-                "relation_name": relation_name,
-                "original_file_path": original_file_path,
-                "unique_id": node_id,
-            }
-
-            logger.debug(f"Cached location for {model_name}: {database}.{schema}")
-
     def get_location(self, model_name: str) -> Optional[Dict[str, str]]:
         """
         Get database and schema for a model by name.
@@ -288,39 +380,41 @@ class ManifestParser:
             return location
 
         # Strategy 2: Match by original_file_path
-        # Normalize paths for comparison (use forward slashes)
-        model_path_str = str(model_path).replace("\\", "/")
-
-        # Convert to Path objects for more precise matching
-        from pathlib import Path as PathObj
-
-        model_path_obj = PathObj(model_path_str)
-
-        for cached_name, cached_location in self.model_locations.items():
-            original_path = cached_location.get("original_file_path", "")
-            if not original_path:
-                continue
-
-            original_path_obj = PathObj(original_path.replace("\\", "/"))
-
-            # Match by comparing resolved paths or checking if one ends with the other
-            # Use parts comparison for more precise matching
-            try:
-                # Check if the paths are the same or if model_path ends with original_path
-                if (
-                    model_path_obj == original_path_obj
-                    or model_path_str.endswith("/" + original_path)
-                    or model_path_obj.parts[-len(original_path_obj.parts) :] == original_path_obj.parts
-                ):
-                    logger.debug(f"Matched by path: {model_path} -> {cached_name}")
-                    return cached_location
-            except (IndexError, ValueError):
-                # Path comparison failed, continue to next candidate
-                continue
+        # A model matches when its original_file_path equals a trailing run of this path's parts,
+        # so probe the index once per suffix; the earliest model in the manifest wins ties.
+        model_parts = PurePosixPath(str(model_path).replace("\\", "/")).parts
+        path_index = self._get_path_index()
+        best = None
+        for start in range(len(model_parts)):
+            candidate = path_index.get(model_parts[start:])
+            if candidate and (best is None or candidate[0] < best[0]):
+                best = candidate
+
+        if best:
+            logger.debug(f"Matched by path: {model_path} -> {best[1]}")
+            return best[2]
 
         logger.debug(f"No manifest entry found for path: {model_path}")
         return None
 
+    def _get_path_index(self) -> Dict[Tuple[str, ...], Tuple[int, str, Dict[str, str]]]:
+        """
+        Index model locations by the parts of their normalized original_file_path.
+
+        Built on first use and rebuilt if model_locations is replaced.
+        """
+        if self._path_index is None or self._path_index[0] is not self.model_locations:
+            index: Dict[Tuple[str, ...], Tuple[int, str, Dict[str, str]]] = {}
+            for position, (model_name, location) in enumerate(self.model_locations.items()):
+                original_path = location.get("original_file_path", "")
+                if not original_path:
+                    continue
+                parts = PurePosixPath(original_path.replace("\\", "/")).parts
+                if parts:
+                    index.setdefault(parts, (position, model_name, location))
+            self._path_index = (self.model_locations, index)
+        return self._path_index[1]
+
     def get_all_models_in_directory(self, directory: Path) -> List[Dict[str, any]]:
         """
         Get all models that exist under a specific directory.
@@ -444,17 +538,19 @@ class ManifestParser:
         if not location:
             return {"matches": False, "differences": [f"Model '{model_name}' not found in manifest"]}
 
-        differences = []
+        # Compare case-insensitively; the common matching case is a single tuple comparison
+        manifest_pair = (location["database"].upper(), location["schema"].upper())
+        yaml_pair = (yaml_database.upper(), yaml_schema.upper())
+        if manifest_pair == yaml_pair:
+            return {"matches": True, "differences": []}
 
-        # Compare database (case-insensitive)
-        if location["database"].upper() != yaml_database.upper():
+        differences = []
+        if manifest_pair[0] != yaml_pair[0]:
             differences.append(f"database: {yaml_database} (yaml) vs {location['database']} (manifest)")
-
-        # Compare schema (case-insensitive)
-        if location["schema"].upper() != yaml_schema.upper():
+        if manifest_pair[1] != yaml_pair[1]:
             differences.append(f"schema: {yaml_schema} (yaml) vs {location['schema']} (manifest)")
 
-        return {"matches": len(differences) == 0, "differences": differences}
+        return {"matches": False, "differences": differences}
 
     def get_summary(self) -> Dict[str, any]:
         """
@@ -466,14 +562,18 @@ class ManifestParser:
         if not self.manifest:
             return {"loaded": False}
 
-        nodes = self.manifest.get("nodes", {})
-        model_count = len([k for k in nodes.keys() if k.startswith("model.")])
+        if self._model_counts is not None:
+            # Counted while load() indexed the nodes
+            model_count, databases = self._model_counts[0], dict(self._model_counts[1])
+        else:
+            nodes = self.manifest.get("nodes", {})
+            model_count = len([k for k in nodes.keys() if k.startswith("model.")])
 
-        # Count by database
-        databases = {}
-        for location in self.model_locations.values():
-            db = location["database"]
-            databases[db] = databases.get(db, 0) + 1
+            # Count by database
+            databases = {}
+            for location in self.model_locations.values():
+                db = location["database"]
+                databases[db] = databases.get(db, 0) + 1
 
         return {
             "loaded": True,
@@ -521,14 +621,15 @@ class ManifestParser:
             return (True, "Manifest file not found")
 
         try:
-            # Get manifest modification time
-            manifest_mtime = os.path.getmtime(self.manifest_path)
-            manifest_time = datetime.fromtimestamp(manifest_mtime)
-            age = datetime.now() - manifest_time
+            # Get manifest modification time; compare in integer nanoseconds
+            manifest_stat = self.manifest_path.stat()
+            manifest_mtime_ns = manifest_stat.st_mtime_ns
+            age_ns = time.time_ns() - manifest_mtime_ns
 
             # Check 1: Age threshold
-            if age.total_seconds() > (threshold_hours * 3600):
-                hours = int(age.total_seconds() / 3600)
+            if age_ns > threshold_hours * _NS_PER_HOUR:
+                manifest_time = datetime.fromtimestamp(manifest_stat.st_mtime)
+                hours = age_ns // _NS_PER_HOUR
                 days = hours // 24
                 if days > 0:
                     return (
@@ -544,23 +645,12 @@ class ManifestParser:
             # Check 2: Are any .sql files newer than manifest?
             models_dir = Path.cwd() / "models"
             if models_dir.exists():
-                sql_files = list(models_dir.rglob("*.sql"))
-                newer_files = []
-
-                for sql_file in sql_files:
-                    try:
-                        if os.path.getmtime(sql_file) > manifest_mtime:
-                            newer_files.append(sql_file.name)
-                            # Stop after finding a few to avoid long messages
-                            if len(newer_files) >= 3:
-                                break
-                    except Exception:
-                        pass  # Skip files we can't check
+                # Stop walking after finding a few to avoid long messages
+                newer_files = list(islice(self._iter_newer_sql_files(str(models_dir), manifest_mtime_ns), 3))
 
                 if newer_files:
-                    files_str = ", ".join(newer_files[:3])
-                    more = f" and {len(newer_files) - 3} more" if len(newer_files) > 3 else ""
-                    return (True, f"Model files modified since manifest ({files_str}{more})")
+                    files_str = ", ".join(newer_files)
+                    return (True, f"Model files modified since manifest ({files_str})")
 
             # Manifest is fresh
             return (False, None)
@@ -569,6 +659,35 @@ class ManifestParser:
             logger.warning(f"Could not check manifest staleness: {e}")
             return (False, None)  # Assume fresh if we can't check
 
+    @classmethod
+    def _iter_newer_sql_files(cls, directory: str, cutoff_ns: int) -> Iterator[str]:
+        """
+        Lazily yield names of .sql files under directory modified after cutoff_ns (st_mtime_ns).
+
+        Walks with os.scandir in the same order as Path.rglob (a directory's files
+        before its subdirectories, symlinked directories not followed), so callers
+        can stop as soon as they have seen enough.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return  # Skip directories we can't read
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif os.path.normcase(entry.name).endswith(".sql") and entry.stat().st_mtime_ns > cutoff_ns:
+                    yield entry.name
+            except OSError:
+                pass  # Skip files we can't check
+
+        for subdir in subdirs:
+            yield from cls._iter_newer_sql_files(subdir, cutoff_ns)
+
     def compare_to(self, other: "ManifestParser") -> ManifestDiff:
         """
         Compare this manifest to another manifest for change detection.
@@ -649,15 +768,24 @@ class ManifestParser:
         if not self.manifest:
             return None
 
-        # Find the node for this model
-        for node_id, node in self.manifest.get("nodes", {}).items():
-            if node.get("resource_type") != "model":
-                continue
-            if node.get("name") == model_name:
-                checksum_info = node.get("checksum", {})
-                return checksum_info.get("checksum")
+        return self._get_checksum_index().get(model_name)
 
-        return None
+    def _get_checksum_index(self) -> Dict[str, Optional[str]]:
+        """
+        Index model checksums by model name, keeping the first model node for each name.
+
+        Built once per loaded manifest so compare_to does not rescan every node per model.
+        """
+        if self._checksum_index is None or self._checksum_index[0] is not self.manifest:
+            index: Dict[str, Optional[str]] = {}
+            for node in (self.manifest or {}).get("nodes", {}).values():
+                if node.get("resource_type") != "model":
+                    continue
+                model_name = node.get("name")
+                if model_name not in index:
+                    index[model_name] = node.get("checksum", {}).get("checksum")
+            self._checksum_index = (self.manifest, index)
+        return self._checksum_index[1]
 
     def get_models_for_tables(self, table_names: List[str]) -> List[str]:
         """
@@ -17,6 +17,7 @@ component type maps to a specific table in the semantic model schema:
 """
 
 import re
+import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -25,9 +26,13 @@ import yaml
 from snowflake_semantic_tools.core.parsing.parsers.dbt_parser import get_empty_result
 from snowflake_semantic_tools.core.parsing.parsers.error_handler import ErrorTracker, format_yaml_error
 from snowflake_semantic_tools.shared import get_logger
+from snowflake_semantic_tools.shared.utils.file_utils import safe_load_yaml
 
 logger = get_logger("yaml_parser.semantic_parser")
 
+# Matches an unresolved {{ custom_instructions('name') }} template; group 1 is the name
+_CUSTOM_INSTRUCTION_TEMPLATE_PATTERN = re.compile(r'\{\{\s*custom_instructions\([\'"]([^\'")]+)[\'"]\)\s*\}\}')
+
 
 def parse_semantic_model_file(file_path: Path, error_tracker: ErrorTracker) -> Dict[str, List[Dict[str, Any]]]:
     """
@@ -45,7 +50,7 @@ def parse_semantic_model_file(file_path: Path, error_tracker: ErrorTracker) -> D
     try:
         # Load YAML content
         with open(file_path, "r", encoding="utf-8") as f:
-            yaml_content = yaml.safe_load(f)
+            yaml_content = safe_load_yaml(f)
 
         if not yaml_content:
             logger.debug(f"Empty semantic model file: {file_path}")
@@ -186,15 +191,18 @@ def parse_snowflake_relationships(
     """
     relationship_records = []
     relationship_column_records = []
+    source_file = str(file_path)
 
     for relationship in relationships:
         try:
-            # Main relationship record with uppercase formatting
+            # Main relationship record with uppercase formatting. Table names repeat across
+            # relationships, so they are interned like the identifiers in parsed conditions.
+            relationship_name = relationship.get("name", "").upper()
             rel_record = {
-                "relationship_name": relationship.get("name", "").upper(),
-                "left_table_name": relationship.get("left_table", "").upper(),
-                "right_table_name": relationship.get("right_table", "").upper(),
-                "source_file": str(file_path),
+                "relationship_name": relationship_name,
+                "left_table_name": sys.intern(relationship.get("left_table", "").upper()),
+                "right_table_name": sys.intern(relationship.get("right_table", "").upper()),
+                "source_file": source_file,
                 "_has_conditions": bool(relationship.get("relationship_conditions")),
             }
             relationship_records.append(rel_record)
@@ -209,14 +217,18 @@ def parse_snowflake_relationships(
 
                 # Build fully qualified column references for validation
                 left_col_qualified = (
-                    f"{parsed.left_table}.{parsed.left_column}" if parsed.left_table and parsed.left_column else ""
+                    sys.intern(f"{parsed.left_table}.{parsed.left_column}")
+                    if parsed.left_table and parsed.left_column
+                    else ""
                 )
                 right_col_qualified = (
-                    f"{parsed.right_table}.{parsed.right_column}" if parsed.right_table and parsed.right_column else ""
+                    sys.intern(f"{parsed.right_table}.{parsed.right_column}")
+                    if parsed.right_table and parsed.right_column
+                    else ""
                 )
 
                 rel_col_record = {
-                    "relationship_name": relationship.get("name", "").upper(),
+                    "relationship_name": relationship_name,
                     "join_condition": condition,
                     "condition_type": parsed.condition_type.value,
                     "left_expression": parsed.left_expression,
@@ -224,7 +236,7 @@ def parse_snowflake_relationships(
                     "left_column": left_col_qualified,
                     "right_column": right_col_qualified,
                     "operator": parsed.operator,
-                    "source_file": str(file_path),
+                    "source_file": source_file,
                     "left_has_expression": parsed.left_has_expression,
                     "right_has_expression": parsed.right_has_expression,
                     "left_unresolved_expression": parsed.left_unresolved_expression,
@@ -347,23 +359,26 @@ def _extract_table_name_from_template(template: str) -> str:
 def parse_snowflake_custom_instructions(instructions: List[Dict[str, Any]], file_path: Path) -> List[Dict[str, Any]]:
     """Parse snowflake_custom_instructions from semantic model files."""
     instruction_records = []
+    source_file = str(file_path)
 
     for instruction in instructions:
         try:
-            question_cat = (
-                instruction.get("ai_question_categorization") or instruction.get("question_categorization", "")
-            ).strip()
-            sql_gen = (instruction.get("ai_sql_generation") or instruction.get("sql_generation", "")).strip()
+            get = instruction.get
+            ai_question_cat = get("ai_question_categorization")
+            ai_sql_gen = get("ai_sql_generation")
+            legacy_question_cat = get("question_categorization", "")
+            legacy_sql_gen = get("sql_generation", "")
+
+            question_cat = (ai_question_cat or legacy_question_cat).strip()
+            sql_gen = (ai_sql_gen or legacy_sql_gen).strip()
 
             instruction_record = {
-                "name": instruction.get("name", "").upper(),
+                "name": get("name", "").upper(),
                 "question_categorization": question_cat if question_cat else None,
                 "sql_generation": sql_gen if sql_gen else None,
-                "source_file": str(file_path),
-                "_used_legacy_keys": bool(
-                    instruction.get("question_categorization") or instruction.get("sql_generation")
-                )
-                and not (instruction.get("ai_question_categorization") or instruction.get("ai_sql_generation")),
+                "source_file": source_file,
+                "_used_legacy_keys": bool(legacy_question_cat or legacy_sql_gen)
+                and not (ai_question_cat or ai_sql_gen),
             }
             instruction_records.append(instruction_record)
 
@@ -465,12 +480,9 @@ def parse_semantic_views(
                 if not isinstance(custom_instructions, list):
                     custom_instructions = [custom_instructions] if custom_instructions else []
 
-                import re
-
-                pattern = r'\{\{\s*custom_instructions\([\'"]([^\'")]+)[\'"]\)\s*\}\}'
                 for inst in custom_instructions:
                     if isinstance(inst, str):
-                        match = re.search(pattern, inst)
+                        match = _CUSTOM_INSTRUCTION_TEMPLATE_PATTERN.search(inst)
                         if match:
                             instruction_names.append(match.group(1).upper())
 
@@ -23,6 +23,19 @@ to UPPERCASE for lookups and resolution to match Snowflake's behavior:
 import re
 from typing import Any, Dict, List, Optional
 
+# Pattern to match {{ ref('arg1') }} or {{ ref('arg1', 'arg2') }}
+# Handles both single and double quotes, with optional whitespace.
+_REF_PATTERN = re.compile(r'\{\{\s*ref\s*\(\s*[\'"]([^\'"]+)[\'"]\s*(?:,\s*[\'"]([^\'"]+)[\'"])?\s*\)\s*\}\}')
+
+# Legacy and single-purpose template patterns, compiled once per process
+_TABLE_PATTERN = re.compile(r'\{\{\s*table\([\'"]([^\'")]+)[\'"]\)\s*\}\}')
+_COLUMN_PATTERN = re.compile(r'\{\{\s*column\([\'"]([^\'")]+)[\'"],\s*[\'"]([^\'")]+)[\'"]\)\s*\}\}')
+_METRIC_PATTERN = re.compile(r'\{\{\s*metric\([\'"]([^\'")]+)[\'"]\)\s*\}\}')
+_CUSTOM_INSTRUCTIONS_PATTERN = re.compile(r'\{\{\s*custom_instructions\([\'"]([^\'")]+)[\'"]\)\s*\}\}')
+
+# Used only on the error path to find the metric that contains a bad reference
+_NAME_LINE_PATTERN = re.compile(r'^\s*-?\s*name:\s*["\']?(\w+)["\']?')
+
 
 class TemplateResolver:
     """
@@ -133,6 +146,23 @@ class TemplateResolver:
 
         return content
 
+    def resolve_many(self, contents: List[str]) -> List[str]:
+        """
+        Resolve template references in a batch of strings.
+
+        Equivalent to calling resolve_content() on each item, but skips the
+        multi-pass resolution entirely for strings without any template markers,
+        which is the common case for most fields in a semantic model.
+
+        Args:
+            contents: Strings with (or without) template references
+
+        Returns:
+            List of resolved strings, in the same order as the input
+        """
+        resolve_content = self.resolve_content
+        return [resolve_content(content) if content and "{{" in content else content for content in contents]
+
     def _resolve_ref_references(self, content: str) -> str:
         """
         Resolve unified {{ ref('table') }} and {{ ref('table', 'column') }} references.
@@ -144,13 +174,10 @@ class TemplateResolver:
         Tables are resolved to their uppercase form and validated against
         the dbt catalog when available.
         """
-        # Pattern to match {{ ref('arg1') }} or {{ ref('arg1', 'arg2') }}
-        # Handles both single and double quotes, with optional whitespace
-        pattern = r'\{\{\s*ref\s*\(\s*[\'"]([^\'"]+)[\'"]\s*(?:,\s*[\'"]([^\'"]+)[\'"])?\s*\)\s*\}\}'
 
         def replace_ref(match):
             first_arg = match.group(1)
-            second_arg = match.group(2) if match.lastindex >= 2 else None
+            second_arg = match.group(2)
 
             if second_arg is not None:
                 # Two arguments: {{ ref('table', 'column') }} → TABLE.COLUMN
@@ -174,7 +201,7 @@ class TemplateResolver:
                 # Default to uppercase even if not in catalog
                 return table_name.upper()
 
-        return re.sub(pattern, replace_ref, content)
+        return _REF_PATTERN.sub(replace_ref, content)
 
     def _resolve_table_references(self, content: str) -> str:
         """
@@ -183,7 +210,6 @@ class TemplateResolver:
         Tables are resolved to their uppercase form and validated against
         the dbt catalog when available.
         """
-        pattern = r'\{\{\s*table\([\'"]([^\'")]+)[\'"]\)\s*\}\}'
 
         def replace_table(match):
             table_name = match.group(1).lower()
@@ -201,7 +227,7 @@ class TemplateResolver:
             # Default to uppercase even if not in catalog
             return table_name.upper()
 
-        return re.sub(pattern, replace_table, content)
+        return _TABLE_PATTERN.sub(replace_table, content)
 
     def _resolve_column_references(self, content: str) -> str:
         """
@@ -209,7 +235,6 @@ class TemplateResolver:
 
         Columns are formatted as TABLE.COLUMN in uppercase.
         """
-        pattern = r'\{\{\s*column\([\'"]([^\'")]+)[\'"],\s*[\'"]([^\'")]+)[\'"]\)\s*\}\}'
 
         def replace_column(match):
             table_name = match.group(1)
@@ -217,7 +242,7 @@ class TemplateResolver:
             # Return TABLE.COLUMN format
             return f"{table_name.upper()}.{column_name.upper()}"
 
-        return re.sub(pattern, replace_column, content)
+        return _COLUMN_PATTERN.sub(replace_column, content)
 
     def _resolve_metric_references(self, content: str) -> str:
         """
@@ -226,7 +251,6 @@ class TemplateResolver:
         Metrics can reference other metrics, creating a composition chain.
         This method handles recursive resolution with circular dependency detection.
         """
-        pattern = r'\{\{\s*metric\([\'"]([^\'")]+)[\'"]\)\s*\}\}'
 
         def replace_metric(match):
             metric_name = match.group(1)
@@ -244,7 +268,7 @@ class TemplateResolver:
                     if i < len(lines):
                         line = lines[i]
                         # Look for "- name:" pattern
-                        name_match = re.search(r'^\s*-?\s*name:\s*["\']?(\w+)["\']?', line)
+                        name_match = _NAME_LINE_PATTERN.search(line)
                         if name_match:
                             context_metric = name_match.group(1)
                             break
@@ -261,7 +285,7 @@ class TemplateResolver:
             # Wrap in parentheses to preserve order of operations
             return f"({resolved})"
 
-        return re.sub(pattern, replace_metric, content)
+        return _METRIC_PATTERN.sub(replace_metric, content)
 
     def _resolve_custom_instructions_references(self, content: str) -> str:
         """
@@ -274,7 +298,6 @@ class TemplateResolver:
         the SM_CUSTOM_INSTRUCTIONS table. This keeps the YAML valid and allows
         users to use the same unquoted syntax as {{ table() }} templates.
         """
-        pattern = r'\{\{\s*custom_instructions\([\'"]([^\'")]+)[\'"]\)\s*\}\}'
 
         def replace_custom_instructions(match):
             instruction_name = match.group(1)
@@ -295,7 +318,7 @@ class TemplateResolver:
             # The full instruction text is looked up during DDL generation
             return instruction_key
 
-        return re.sub(pattern, replace_custom_instructions, content)
+        return _CUSTOM_INSTRUCTIONS_PATTERN.sub(replace_custom_instructions, content)
 
     def resolve_metric(self, metric_name: str) -> str:
         """
@@ -458,7 +458,7 @@ class SemanticModelValidator:
                                 )
 
                             # Warn about ASOF conditions (best practice)
-                            if parsed.condition_type == JoinType.ASOF and i == 0:
+                            if parsed.condition_type is JoinType.ASOF and i == 0:
                                 result.add_warning(
                                     f"Relationship '{rel_name}' has ASOF condition as first condition - consider putting equality condition first",
                                     file_path=source_file,
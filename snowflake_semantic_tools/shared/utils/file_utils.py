@@ -5,6 +5,7 @@ Simple file finding operations for dbt and semantic model files.
 Replaces Git infrastructure - assumes running from dbt project root.
 """
 
+import sys
 from pathlib import Path
 from typing import Any, List, Optional, Tuple
 
@@ -12,8 +13,45 @@ import yaml
 
 from snowflake_semantic_tools.shared.utils.logger import get_logger
 
+try:
+    # Optional: libyaml's C loader tokenizes several times faster than the pure-Python one.
+    # It raises the same yaml.MarkedYAMLError subclasses, so error formatting is unchanged.
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
 logger = get_logger(__name__)
 
+# Scalars up to this length (keys like column_type, values like dimension) share one string object
+_INTERN_MAX_LENGTH = 32
+
+
+class _InterningSafeLoader(_YamlSafeLoader):
+    """Safe loader that interns short strings, which repeat for every model and column."""
+
+    def construct_yaml_str(self, node: yaml.ScalarNode) -> str:
+        value = self.construct_scalar(node)
+        return sys.intern(value) if len(value) <= _INTERN_MAX_LENGTH else value
+
+
+_InterningSafeLoader.add_constructor("tag:yaml.org,2002:str", _InterningSafeLoader.construct_yaml_str)
+
+
+def safe_load_yaml(stream: Any) -> Any:
+    """
+    Drop-in replacement for yaml.safe_load that uses libyaml when available.
+
+    Short strings are interned, so keys and enum-like values repeated across a project's
+    models and columns are stored once.
+
+    Args:
+        stream: YAML string or open file
+
+    Returns:
+        Parsed YAML content
+    """
+    return yaml.load(stream, Loader=_InterningSafeLoader)
+
 
 def get_dbt_model_paths() -> List[Path]:
     """
@@ -147,7 +185,7 @@ def _is_dbt_model_file(file_path: Path) -> bool:
     """
     try:
         with open(file_path, "r") as f:
-            content = yaml.safe_load(f)
+            content = safe_load_yaml(f)
             return isinstance(content, dict) and "models" in content
     except Exception:
         return False
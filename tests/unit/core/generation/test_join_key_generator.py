@@ -8,6 +8,8 @@ Tests cover:
 - get_dimensions_for_table filtering
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from snowflake_semantic_tools.core.generation.join_key_generator import (
@@ -257,6 +259,13 @@ class TestDetectResolvedExpression:
         result = detect_expression("CUSTOMER_ID")
         assert result is None
 
+    def test_resolved_side_skips_template_scan(self):
+        with patch("snowflake_semantic_tools.core.generation.join_key_generator.TEMPLATE_PATTERN") as mock_pattern:
+            result = detect_expression("DATE(ORDERS.ORDERED_AT)")
+            assert has_wrapping_text("DATE(ORDERS.ORDERED_AT)") is True
+        assert result["sql_expression"] == "DATE(ORDERED_AT)"
+        mock_pattern.finditer.assert_not_called()
+
 
 class TestGenericExpressionDetection:
     """With the generic approach, ANY expression wrapping a column template is detected."""
@@ -180,6 +180,12 @@ class TestRefEdgeCases:
         result = resolver.resolve_content("{{ ref('table_2024', 'col_123') }}")
         assert result == "TABLE_2024.COL_123"
 
+    def test_ref_with_non_ascii_characters(self):
+        """Test ref() uppercases non-ASCII identifiers the same way as str.upper()."""
+        resolver = TemplateResolver()
+        result = resolver.resolve_content("{{ ref('straße', 'größe') }}")
+        assert result == "STRASSE.GRÖSSE"
+
     def test_ref_nested_in_function_call(self):
         """Test ref() nested in SQL function calls."""
         resolver = TemplateResolver()
@@ -202,6 +208,13 @@ class TestRefEdgeCases:
         assert "ORDERS.AMOUNT" in result
         assert "ORDERS.QUANTITY" in result
 
+    def test_ref_unclosed_left_untouched(self):
+        """Test unterminated ref() tags are left as-is instead of being partially resolved."""
+        resolver = TemplateResolver()
+        content = "{{ ref('orders', 'amount') " + " " * 5000
+        result = resolver.resolve_content(content)
+        assert result == content
+
 
 class TestRefResolutionOrder:
     """Test that ref() resolution order is correct."""
@@ -223,3 +236,27 @@ class TestRefResolutionOrder:
         # This is a bit unusual but should still work
         result = resolver.resolve_content(content)
         assert "ORDERS" in result
+
+
+class TestResolveMany:
+    """Test batch resolution via resolve_many()."""
+
+    def test_resolve_many_matches_resolve_content(self):
+        """Test resolve_many() returns the same results as per-item resolve_content()."""
+        resolver = TemplateResolver(dbt_catalog={"orders": {"name": "orders"}})
+        contents = [
+            "{{ ref('orders') }}",
+            "SUM({{ ref('orders', 'amount') }})",
+            "{{ column('orders', 'tax') }}",
+        ]
+        assert resolver.resolve_many(contents) == [resolver.resolve_content(c) for c in contents]
+
+    def test_resolve_many_passes_through_plain_strings(self):
+        """Test strings without templates are returned unchanged and order is preserved."""
+        resolver = TemplateResolver()
+        contents = ["", "plain text", "{{ ref('orders', 'id') }}", "COUNT(*)"]
+        assert resolver.resolve_many(contents) == ["", "plain text", "ORDERS.ID", "COUNT(*)"]
+
+    def test_resolve_many_empty_list(self):
+        """Test resolve_many() on an empty batch."""
+        assert TemplateResolver().resolve_many([]) == []
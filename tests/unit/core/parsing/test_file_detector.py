@@ -96,6 +96,12 @@ class TestFileTypeDetector:
         bad_file2.write_text("{{jinja}}\nsnowflake_metrics:\n  - broken")
         assert detector.detect_file_type(bad_file2) == "semantic"
 
+    def test_pattern_fallback_uses_priority_not_position(self, detector, tmp_path):
+        """Test fallback detection picks the highest-priority pattern, not the first one in the file"""
+        jinja_file = tmp_path / "jinja.yml"
+        jinja_file.write_text("{{ config() }}\nmodels:\n  - x\nsnowflake_filters:\n  - name: f\nsnowflake_metrics:\n")
+        assert detector.detect_semantic_type(jinja_file) == "metrics"
+
     def test_large_file(self, detector, tmp_path):
         """Test detection in large files"""
         large_file = tmp_path / "large.yml"
@@ -105,6 +111,34 @@ class TestFileTypeDetector:
         large_file.write_text(content)
         assert detector.detect_file_type(large_file) == "semantic"
 
+    def test_single_key_skips_yaml_parse(self, detector, tmp_path):
+        """Test files with a single unambiguous root key are classified without parsing YAML"""
+        metrics_file = tmp_path / "metrics.yml"
+        metrics_file.write_text("snowflake_metrics:\n  - name: revenue")
+        with patch("snowflake_semantic_tools.core.parsing.file_detector.safe_load_yaml") as mock_load:
+            assert detector.detect_semantic_type(metrics_file) == "metrics"
+            mock_load.assert_not_called()
+
+    def test_unchanged_file_detection_is_cached(self, detector, tmp_path):
+        """Test an unchanged file is only read once across repeated detections"""
+        metrics_file = tmp_path / "cached.yml"
+        metrics_file.write_text("snowflake_metrics:\n  - name: revenue")
+        with patch.object(
+            FileTypeDetector, "_read_and_scan_keys", wraps=FileTypeDetector._read_and_scan_keys
+        ) as mock_read:
+            assert detector.detect_semantic_type(metrics_file) == "metrics"
+            assert detector.detect_semantic_type(metrics_file) == "metrics"
+            assert mock_read.call_count == 1
+
+    def test_modified_file_is_redetected(self, detector, tmp_path):
+        """Test a file whose size or mtime changed is classified again"""
+        changing_file = tmp_path / "changing.yml"
+        changing_file.write_text("snowflake_metrics:\n  - name: revenue")
+        assert detector.detect_semantic_type(changing_file) == "metrics"
+
+        changing_file.write_text("snowflake_relationships:\n  - name: orders_to_customers")
+        assert detector.detect_semantic_type(changing_file) == "relationships"
+
     def test_unicode_content(self, detector, tmp_path):
         """Test files with unicode content"""
         unicode_file = tmp_path / "unicode.yml"
@@ -4,9 +4,11 @@ Comprehensive tests for FileTypeDetector.
 Tests file type detection across all supported semantic model types.
 """
 
+import io
 import tempfile
+import time
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -14,92 +16,94 @@ import yaml
 from snowflake_semantic_tools.core.parsing.file_detector import FileTypeDetector
 
 
-class TestFileTypeDetector:
-    """Test FileTypeDetector with comprehensive scenarios."""
+def _fake_open(data):
+    """Return an open() replacement serving ``data`` from memory as a binary file."""
+    payload = data.encode() if isinstance(data, str) else data
+    return lambda *args, **kwargs: io.BytesIO(payload)
 
-    @pytest.fixture
-    def detector(self):
-        """Create FileTypeDetector instance."""
-        return FileTypeDetector()
 
-    def test_detect_metrics_file(self, detector):
-        """Test detection of metrics files."""
-        metrics_content = """
+# (name, file content, expected file type) for each semantic model type, shared across tests
+_SEMANTIC_SAMPLES = (
+    (
+        "metrics",
+        """
         snowflake_metrics:
           - name: total_revenue
             expr: SUM(amount)
             tables: [orders]
+        """,
+        "semantic",
+    ),
+    (
+        "relationships",
         """
-
-        with patch("builtins.open", mock_open(read_data=metrics_content)):
-            file_type = detector.detect_file_type("metrics.yml")
-            assert file_type == "semantic"
-
-    def test_detect_relationships_file(self, detector):
-        """Test detection of relationships files."""
-        relationships_content = """
         snowflake_relationships:
           - name: orders_to_users
             left_table: orders
             right_table: users
             relationship_type: many_to_one
+        """,
+        "semantic",
+    ),
+    (
+        "filters",
         """
-
-        with patch("builtins.open", mock_open(read_data=relationships_content)):
-            file_type = detector.detect_file_type("relationships.yml")
-            assert file_type == "semantic"
-
-    def test_detect_filters_file(self, detector):
-        """Test detection of filters files."""
-        filters_content = """
         snowflake_filters:
           - name: active_users
             expr: "status = 'active'"
             tables: [users]
+        """,
+        "semantic",
+    ),
+    (
+        "custom_instructions",
         """
-
-        with patch("builtins.open", mock_open(read_data=filters_content)):
-            file_type = detector.detect_file_type("filters.yml")
-            assert file_type == "semantic"
-
-    def test_detect_custom_instructions_file(self, detector):
-        """Test detection of custom instructions files."""
-        instructions_content = """
         snowflake_custom_instructions:
           - name: business_rules
             question_categorization: "Focus on active users"
             sql_generation: "Exclude test data"
+        """,
+        "semantic",
+    ),
+    (
+        "verified_queries",
         """
-
-        with patch("builtins.open", mock_open(read_data=instructions_content)):
-            file_type = detector.detect_file_type("custom_instructions.yml")
-            assert file_type == "semantic"
-
-    def test_detect_verified_queries_file(self, detector):
-        """Test detection of verified queries files."""
-        queries_content = """
         snowflake_verified_queries:
           - name: monthly_revenue
             question: "What is monthly revenue?"
             sql: "SELECT SUM(amount) FROM orders"
+        """,
+        "semantic",
+    ),
+    (
+        "semantic_views",
         """
-
-        with patch("builtins.open", mock_open(read_data=queries_content)):
-            file_type = detector.detect_file_type("verified_queries.yml")
-            assert file_type == "semantic"
-
-    def test_detect_semantic_views_file(self, detector):
-        """Test detection of semantic views files."""
-        views_content = """
         semantic_views:
           - name: sales_dashboard
             tables: [orders, users]
             metrics: [total_revenue]
-        """
+        """,
+        "semantic",
+    ),
+)
 
-        with patch("builtins.open", mock_open(read_data=views_content)):
-            file_type = detector.detect_file_type("semantic_views.yml")
-            assert file_type == "semantic"
+
+class TestFileTypeDetector:
+    """Test FileTypeDetector with comprehensive scenarios."""
+
+    @pytest.fixture(scope="module")
+    def detector(self):
+        """Create FileTypeDetector instance."""
+        return FileTypeDetector()
+
+    @pytest.mark.parametrize(
+        "content,expected", [pytest.param(content, expected, id=name) for name, content, expected in _SEMANTIC_SAMPLES]
+    )
+    def test_detect_semantic_variants(self, detector, content, expected):
+        """Test detection of each semantic model file type."""
+        with patch("builtins.open", _fake_open(content)):
+            file_type = detector.detect_file_type("semantic.yml")
+            assert file_type == expected
 
     def test_detect_dbt_file(self, detector):
         """Test detection of dbt model files."""
@@ -113,7 +117,7 @@ class TestFileTypeDetector:
                 description: "User ID"
         """
 
-        with patch("builtins.open", mock_open(read_data=dbt_content)):
+        with patch("builtins.open", _fake_open(dbt_content)):
             file_type = detector.detect_file_type("schema.yml")
             assert file_type == "dbt"
 
@@ -129,14 +133,14 @@ class TestFileTypeDetector:
             expr: "status = 'active'"
         """
 
-        with patch("builtins.open", mock_open(read_data=mixed_content)):
+        with patch("builtins.open", _fake_open(mixed_content)):
             file_type = detector.detect_file_type("mixed.yml")
             # Should detect the first type found
             assert file_type == "semantic"
 
     def test_detect_empty_file(self, detector):
         """Test detection of empty files."""
-        with patch("builtins.open", mock_open(read_data="")):
+        with patch("builtins.open", _fake_open(b"")):
             file_type = detector.detect_file_type("empty.yml")
             assert file_type == "unknown"
 
@@ -149,7 +153,7 @@ class TestFileTypeDetector:
         # Missing closing bracket
         """
 
-        with patch("builtins.open", mock_open(read_data=invalid_yaml)):
+        with patch("builtins.open", _fake_open(invalid_yaml)):
             file_type = detector.detect_file_type("invalid.yml")
             # Even invalid YAML is detected as semantic if it contains semantic patterns
             assert file_type == "semantic"
@@ -162,7 +166,7 @@ class TestFileTypeDetector:
           setting2: value2
         """
 
-        with patch("builtins.open", mock_open(read_data=non_semantic_content)):
+        with patch("builtins.open", _fake_open(non_semantic_content)):
             file_type = detector.detect_file_type("config.yml")
             assert file_type == "unknown"
 
@@ -187,7 +191,7 @@ class TestFileTypeDetector:
             expr: COUNT(*)
         """
 
-        with patch("builtins.open", mock_open(read_data=lowercase_content)):
+        with patch("builtins.open", _fake_open(lowercase_content)):
             file_type = detector.detect_file_type("test.yml")
             assert file_type == "semantic"
 
@@ -198,7 +202,7 @@ class TestFileTypeDetector:
             expr: COUNT(*)
         """
 
-        with patch("builtins.open", mock_open(read_data=uppercase_content)):
+        with patch("builtins.open", _fake_open(uppercase_content)):
             file_type = detector.detect_file_type("test.yml")
             assert file_type == "unknown"
 
@@ -216,7 +220,7 @@ class TestFileTypeDetector:
             expr: SUM(amount)
         """
 
-        with patch("builtins.open", mock_open(read_data=metrics_content)):
+        with patch("builtins.open", _fake_open(metrics_content)):
             file_type = detector.detect_file_type(Path("metrics.yml"))
             assert file_type == "semantic"
 
@@ -229,7 +233,7 @@ class TestFileTypeDetector:
         """
 
         for extension in [".yml", ".yaml"]:
-            with patch("builtins.open", mock_open(read_data=metrics_content)):
+            with patch("builtins.open", _fake_open(metrics_content)):
                 file_type = detector.detect_file_type(f"metrics{extension}")
                 assert file_type == "semantic"
 
@@ -244,31 +248,26 @@ class TestFileTypeDetector:
             tables: [orders]
         """
 
-        with patch("builtins.open", mock_open(read_data=content_with_comments)):
+        with patch("builtins.open", _fake_open(content_with_comments)):
             file_type = detector.detect_file_type("metrics.yml")
             assert file_type == "semantic"
 
     def test_detect_large_file_performance(self, detector):
         """Test detection performance with large files."""
         # Create a large metrics file
-        large_content = "snowflake_metrics:\n"
-        for i in range(1000):
-            large_content += f"""
-  - name: metric_{i}
-    expr: SUM(column_{i})
-    tables: [table_{i}]
-"""
-
-        with patch("builtins.open", mock_open(read_data=large_content)):
-            import time
+        large_content = "snowflake_metrics:\n" + "".join(
+            f"\n  - name: metric_{i}\n    expr: SUM(column_{i})\n    tables: [table_{i}]\n" for i in range(1000)
+        )
 
-            start_time = time.time()
+        with patch("builtins.open", _fake_open(large_content)):
+            start_ns = time.perf_counter_ns()
             file_type = detector.detect_file_type("large_metrics.yml")
-            end_time = time.time()
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
             assert file_type == "semantic"
-            # Should complete quickly (less than 1 second)
-            assert (end_time - start_time) < 1.0
+            # A single-key file (~70 KB) is classified by one regex scan over its bytes, with no
+            # YAML parse; that takes a few ms, while a full pure-Python YAML parse takes several times the budget
+            assert elapsed_ns < 50_000_000
 
     def test_detect_unicode_content(self, detector):
         """Test detection with unicode content."""
@@ -280,25 +279,18 @@ class TestFileTypeDetector:
             tables: [orders_français]
         """
 
-        with patch("builtins.open", mock_open(read_data=unicode_content)):
+        with patch("builtins.open", _fake_open(unicode_content)):
             file_type = detector.detect_file_type("unicode_metrics.yml")
             assert file_type == "semantic"
 
     def test_batch_detection(self, detector):
         """Test batch detection of multiple files."""
-        files_and_content = {
-            "metrics.yml": "snowflake_metrics:\n  - name: test",
-            "relationships.yml": "snowflake_relationships:\n  - name: test",
-            "filters.yml": "snowflake_filters:\n  - name: test",
-            "unknown.yml": "some_config:\n  setting: value",
-        }
+        files_and_content = {f"{name}.yml": (content, expected) for name, content, expected in _SEMANTIC_SAMPLES}
+        files_and_content["unknown.yml"] = ("some_config:\n  setting: value", "unknown")
 
         results = {}
-        for filename, content in files_and_content.items():
-            with patch("builtins.open", mock_open(read_data=content)):
+        for filename, (content, _) in files_and_content.items():
+            with patch("builtins.open", _fake_open(content)):
                 results[filename] = detector.detect_file_type(filename)
 
-        assert results["metrics.yml"] == "semantic"
-        assert results["relationships.yml"] == "semantic"
-        assert results["filters.yml"] == "semantic"
-        assert results["unknown.yml"] == "unknown"
+        assert results == {filename: expected for filename, (_, expected) in files_and_content.items()}
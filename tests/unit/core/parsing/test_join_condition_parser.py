@@ -4,6 +4,9 @@ Unit tests for JoinConditionParser - ASOF JOIN SQL generation.
 Tests for Issue #40: Fix ASOF JOIN support in semantic views.
 """
 
+import dataclasses
+from unittest.mock import patch
+
 import pytest
 
 from snowflake_semantic_tools.core.parsing.join_condition_parser import JoinConditionParser, JoinType, ParsedCondition
@@ -196,6 +199,37 @@ class TestParsedConditionDataclass:
             parsed, "match_condition"
         ), "ParsedCondition should not have match_condition field (removed in Issue #40 fix)"
 
+    def test_parsed_condition_is_immutable(self):
+        """Verify parsed conditions are frozen so cached results can be shared safely."""
+        condition = "{{ column('orders', 'customer_id') }} = {{ column('customers', 'id') }}"
+        parsed = JoinConditionParser.parse(condition)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            parsed.left_table = "OTHER"
+
+    def test_parsed_condition_is_hashable(self):
+        """Verify equal parsed conditions hash equally and derived copies are distinct."""
+        condition = "{{ column('orders', 'customer_id') }} = {{ column('customers', 'id') }}"
+        parsed = JoinConditionParser.parse(condition)
+        derived = dataclasses.replace(parsed, right_table="ACCOUNTS")
+
+        assert hash(parsed) == hash(dataclasses.replace(parsed))
+        assert derived.right_table == "ACCOUNTS"
+        assert parsed.right_table == "CUSTOMERS"
+        assert len({parsed, derived}) == 2
+
+    def test_parsed_condition_uses_slots(self):
+        """Verify ParsedCondition instances carry no per-instance __dict__."""
+        parsed = JoinConditionParser.parse("ORDERS.CUSTOMER_ID = CUSTOMERS.ID")
+
+        assert not hasattr(parsed, "__dict__")
+
+    def test_repeated_parse_returns_cached_result(self):
+        """Verify parsing the same condition twice reuses the first result."""
+        condition = "ORDERS.CUSTOMER_ID = CUSTOMERS.ID"
+
+        assert JoinConditionParser.parse(condition) is JoinConditionParser.parse(condition)
+
     def test_parsed_condition_has_required_fields(self):
         """Verify ParsedCondition has all required fields."""
         condition = "{{ column('orders', 'customer_id') }} = {{ column('customers', 'id') }}"
@@ -246,6 +280,20 @@ class TestJoinTypeDetection:
         parsed = JoinConditionParser.parse(condition)
         assert parsed.condition_type == JoinType.UNKNOWN
 
+    def test_not_equal_is_unknown(self):
+        """Test != and <> operators map to UNKNOWN rather than EQUALITY."""
+        for op in ("!=", "<>"):
+            condition = f"{{{{ column('orders', 'customer_id') }}}} {op} {{{{ column('customers', 'id') }}}}"
+            parsed = JoinConditionParser.parse(condition)
+            assert parsed.operator == op
+            assert parsed.condition_type == JoinType.UNKNOWN
+
+    def test_between_is_range(self):
+        """Test BETWEEN operator is detected as RANGE."""
+        condition = "{{ column('orders', 'ordered_at') }} BETWEEN {{ column('rates', 'start_date') }} AND {{ column('rates', 'end_date') }} EXCLUSIVE"
+        parsed = JoinConditionParser.parse(condition)
+        assert parsed.condition_type == JoinType.RANGE
+
 
 class TestValidationUnsupportedOperators:
     """Test that unsupported temporal operators are rejected with clear errors."""
@@ -311,6 +359,33 @@ class TestValidationUnsupportedOperators:
         assert ">" in error_msg
         assert "not supported" in error_msg.lower()
 
+    def test_validate_rejected_operator_skips_full_parse(self):
+        """Test operator-level rejections are decided without parsing the condition sides."""
+        condition = "{{ column('shipments', 'shipped_at') }} <= {{ column('orders', 'delivered_at') }}"
+
+        with patch.object(JoinConditionParser, "parse") as mock_parse:
+            is_valid, error_msg = JoinConditionParser.validate_condition(condition)
+
+        mock_parse.assert_not_called()
+        assert is_valid is False
+        assert "not supported" in error_msg
+
+    def test_validate_repeated_condition_reuses_result(self):
+        """Test validating the same condition twice does not re-parse it."""
+        condition = "{{ column('shipments', 'shipped_at') }} >= {{ column('orders', 'ordered_at') }}"
+        first = JoinConditionParser.validate_condition(condition)
+
+        with patch.object(JoinConditionParser, "parse") as mock_parse:
+            assert JoinConditionParser.validate_condition(condition) == first
+            mock_parse.assert_not_called()
+
+    def test_validate_non_string_condition_reports_error(self):
+        """Test unhashable input is reported as invalid instead of raising from the cache."""
+        is_valid, error_msg = JoinConditionParser.validate_condition(["a"])
+
+        assert is_valid is False
+        assert error_msg.startswith("Error parsing condition:")
+
     def test_validate_greater_than_equal_operator_accepted(self):
         """Test that >= operator is accepted (the only valid ASOF operator)."""
         condition = "{{ column('orders', 'ordered_at') }} >= {{ column('orders', 'ordered_at') }}"
@@ -405,6 +480,18 @@ class TestUnifiedRefSyntax:
         assert parsed.right_table == "CUSTOMERS"
         assert parsed.right_column == "ID"
 
+    def test_ref_preferred_over_column_on_same_side(self):
+        """Test ref() takes priority over column() when a side contains both."""
+        expression = "COALESCE({{ column('legacy', 'old_id') }}, {{ ref('orders', 'customer_id') }})"
+
+        assert JoinConditionParser._extract_table_column_from_template(expression) == ("ORDERS", "CUSTOMER_ID")
+
+    def test_template_after_stray_braces(self):
+        """Test a template is still found after unrelated or unterminated {{ markers."""
+        expression = "{{ not_a_template }} {{{ ref('orders', 'customer_id') }}"
+
+        assert JoinConditionParser._extract_table_column_from_template(expression) == ("ORDERS", "CUSTOMER_ID")
+
 
 class TestExpressionDetectionInParse:
     """Test that parse() correctly detects SQL expressions wrapping column templates."""
@@ -552,6 +639,13 @@ class TestResolvedFormatExpressionDetection:
     have been resolved to TABLE.COLUMN format.
     """
 
+    @pytest.fixture
+    def clear_parse_cache(self):
+        """Run parse() uncached, so tests observe the parse path rather than a memoized result."""
+        JoinConditionParser.parse.cache_clear()
+        yield
+        JoinConditionParser.parse.cache_clear()
+
     def test_resolved_date_expression(self):
         condition = "DATE(ORDERS.ORDERED_AT) = METRICFLOW_TIME_SPINE.DATE_DAY"
         parsed = JoinConditionParser.parse(condition)
@@ -583,6 +677,48 @@ class TestResolvedFormatExpressionDetection:
         assert parsed.left_table == "ORDERS"
         assert parsed.left_column == "CUSTOMER_ID"
 
+    def test_bare_resolved_columns_skip_expression_detection(self, clear_parse_cache):
+        """Bare TABLE.COLUMN sides are extracted directly without running expression detection."""
+        with patch("snowflake_semantic_tools.core.generation.join_key_generator.detect_expression") as mock_detect:
+            parsed = JoinConditionParser.parse("SHIPMENTS.ORDER_ID = ORDERS.ORDER_ID")
+
+        mock_detect.assert_not_called()
+        assert (parsed.left_table, parsed.left_column) == ("SHIPMENTS", "ORDER_ID")
+        assert (parsed.right_table, parsed.right_column) == ("ORDERS", "ORDER_ID")
+        assert parsed.left_has_expression is False
+        assert parsed.right_unresolved_expression == ""
+
+    def test_bare_template_columns_skip_expression_detection(self, clear_parse_cache):
+        """Bare column()/ref() sides are parsed by the single-pass pattern without expression detection."""
+        condition = "{{ column('shipments', 'order_id') }} >= {{ ref('orders', 'order_id') }}"
+        with patch("snowflake_semantic_tools.core.generation.join_key_generator.detect_expression") as mock_detect:
+            parsed = JoinConditionParser.parse(condition)
+
+        mock_detect.assert_not_called()
+        assert parsed.condition_type == JoinType.ASOF
+        assert parsed.left_expression == "{{ column('shipments', 'order_id') }}"
+        assert (parsed.left_table, parsed.left_column) == ("SHIPMENTS", "ORDER_ID")
+        assert (parsed.right_table, parsed.right_column) == ("ORDERS", "ORDER_ID")
+
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            "SHIPMENTS.ORDER_ID = ORDERS.ORDER_ID",
+            "{{ column('shipments', 'order_id') }} = {{ column('orders', 'order_id') }}",
+            "{{ column('shipments', 'order_id') }} = ORDERS.ORDER_ID",
+            "SHIPMENTS.BETWEEN_DATE = ORDERS.ORDER_DATE",
+            "SHIPMENTS.ORDER_ID <> ORDERS.ORDER_ID",
+        ],
+    )
+    def test_single_pass_matches_general_path(self, condition, clear_parse_cache):
+        """The single-pass pattern yields exactly what the general parse path does."""
+        parsed = JoinConditionParser.parse(condition)
+        JoinConditionParser.parse.cache_clear()
+        with patch.object(JoinConditionParser, "_parse_simple", return_value=None):
+            general = JoinConditionParser.parse(condition)
+
+        assert parsed == general
+
 
 class TestUnresolvedExpressionDetection:
     """Test that multi-column expressions set the unresolved_expression fields."""
@@ -690,3 +826,63 @@ class TestExpressionWithRange:
         overrides = {"ORDERS.ORDERED_AT": "_JK_ORDERED_AT_XXXX"}
         sql = JoinConditionParser.generate_sql_references([parsed], "ORDERS", "RATES", join_key_overrides=overrides)
         assert sql == "ORDERS (_JK_ORDERED_AT_XXXX) REFERENCES RATES (BETWEEN START_DATE AND END_DATE EXCLUSIVE)"
+
+
+class TestParseMultiple:
+    """Test batch parsing via parse_multiple()."""
+
+    def test_parse_multiple_matches_parse(self):
+        """Test parse_multiple() returns the same results as per-condition parse(), in order."""
+        conditions = [
+            "{{ column('orders', 'customer_id') }} = {{ column('customers', 'id') }}",
+            "EVENTS.TIMESTAMP >= SESSIONS.START_TIME",
+            "{{ column('orders', 'customer_id') }} = {{ column('customers', 'id') }}",
+        ]
+        parsed_list = JoinConditionParser.parse_multiple(conditions)
+
+        assert parsed_list == [JoinConditionParser.parse(c) for c in conditions]
+        assert [p.condition_type for p in parsed_list] == [JoinType.EQUALITY, JoinType.ASOF, JoinType.EQUALITY]
+
+    def test_identifiers_shared_across_conditions(self):
+        """Test identical table/column names from different conditions are the same string object."""
+        first, second = JoinConditionParser.parse_multiple(
+            [
+                "{{ column('orders', 'customer_id') }} = {{ column('customers', 'id') }}",
+                "ORDERS.CUSTOMER_ID = CUSTOMERS.ID",
+            ]
+        )
+
+        assert first.left_table is second.left_table
+        assert first.left_column is second.left_column
+        assert first.right_table is second.right_table
+
+    def test_parse_many_returns_tuple(self):
+        """Test parse_many() returns an immutable tuple usable by generate_sql_references()."""
+        parsed = JoinConditionParser.parse_many(
+            ["ORDERS.CUSTOMER_ID = ORDERS.CUSTOMER_ID", "ORDERS.ORDERED_AT >= ORDERS.ORDERED_AT"]
+        )
+
+        assert isinstance(parsed, tuple)
+        sql = JoinConditionParser.generate_sql_references(parsed, "ORDERS", "ORDERS")
+        assert sql == "ORDERS (CUSTOMER_ID, ORDERED_AT) REFERENCES ORDERS (CUSTOMER_ID, ASOF ORDERED_AT)"
+
+    def test_parse_multiple_empty(self):
+        """Test parse_multiple() on an empty batch."""
+        assert JoinConditionParser.parse_multiple([]) == []
+
+
+class TestGenerateSqlReferencesRange:
+    """Test generate_sql_references() when range conditions are mixed with others."""
+
+    def test_range_condition_takes_over_clause(self):
+        """Test a BETWEEN condition wins over equality conditions listed before it."""
+        parsed_list = JoinConditionParser.parse_multiple(
+            [
+                "{{ column('orders', 'currency') }} = {{ column('rates', 'currency') }}",
+                "{{ column('orders', 'ordered_at') }} BETWEEN {{ column('rates', 'start_date') }} "
+                "AND {{ column('rates', 'end_date') }} EXCLUSIVE",
+            ]
+        )
+
+        sql = JoinConditionParser.generate_sql_references(parsed_list, "ORDERS", "RATES")
+        assert sql == "ORDERS (ORDERED_AT) REFERENCES RATES (BETWEEN START_DATE AND END_DATE EXCLUSIVE)"
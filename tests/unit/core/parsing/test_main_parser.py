@@ -63,6 +63,32 @@ class TestParser:
             file_type = parser.file_detector.detect_file_type("test.yml")
             assert file_type == "metrics"
 
+    def test_file_detector_shared_across_parsers(self, parser):
+        """Test parsers share one default file detector unless one is assigned."""
+        assert parser._file_detector is None
+        assert parser.file_detector is Parser().file_detector
+
+        custom_detector = Mock()
+        parser.file_detector = custom_detector
+        assert parser.file_detector is custom_detector
+        assert Parser().file_detector is not custom_detector
+
+    def test_file_detector_restored_after_patch(self, parser):
+        """Test patching the detector does not leave the mock behind."""
+        with patch.object(parser, "file_detector") as mock_detector:
+            assert parser.file_detector is mock_detector
+
+        assert parser.file_detector is not mock_detector
+        assert callable(parser.file_detector.detect_semantic_type)
+
+    def test_parser_construction_does_not_build_detector(self):
+        """Test constructing a parser leaves the shared file detector untouched until first use."""
+        with patch("snowflake_semantic_tools.core.parsing.parser._default_file_detector") as mock_default:
+            parser = Parser()
+            mock_default.assert_not_called()
+
+            assert parser.file_detector is mock_default.return_value
+
     def test_parser_error_handling(self, parser):
         """Test parser error handling."""
         # Test with invalid input
@@ -132,29 +158,31 @@ class TestParserPerformance:
         # Should be reasonable size (< 1KB for empty parser)
         assert initial_size < 1024
 
-    def test_parser_thread_safety_basic(self):
-        """Test basic parser thread safety."""
-        import threading
+    def test_parser_state_lives_in_slots(self):
+        """Test parser state is stored in slots rather than the instance dict."""
+        parser = Parser()
 
-        results = []
+        assert vars(parser) == {}
+        assert parser.dbt_catalog == {}
+        assert parser.parsed_files == []
 
-        def create_parser_in_thread():
-            parser = Parser()
-            results.append(parser is not None)
+    def test_parser_thread_safety_basic(self):
+        """Test parsers run concurrently without sharing mutable state."""
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Create parsers in multiple threads
-        threads = []
-        for _ in range(5):
-            thread = threading.Thread(target=create_parser_in_thread)
-            threads.append(thread)
-            thread.start()
+        def parse_in_thread(_):
+            parser = Parser()
+            return parser, parser.parse_all_files([], [])
 
-        for thread in threads:
-            thread.join()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outcomes = list(executor.map(parse_in_thread, range(100)))
 
-        # All threads should successfully create parsers
-        assert len(results) == 5
-        assert all(results)
+        # Every parser ran to completion with its own catalogs and results
+        assert len(outcomes) == 100
+        assert len({id(parser.dbt_catalog) for parser, _ in outcomes}) == 100
+        for parser, result in outcomes:
+            assert result["metadata"]["errors"] == []
+            assert parser.parsed_files == []
 
 
 class TestCustomInstructionsParsingEdgeCases:
@@ -279,9 +307,9 @@ class TestSemanticViewsInstructionExtractionEdgeCases:
 class TestInstructionNameExtractionEdgeCases:
     """Test edge cases in extracting instruction names from YAML content."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def parser(self):
-        """Create Parser instance."""
+        """Create one Parser for the class; name extraction does not touch parser state."""
         return Parser()
 
     def test_extract_from_yaml_with_no_views(self, parser):
@@ -7,50 +7,67 @@ Tests the dbt manifest.json parser for database/schema resolution.
 
 import json
 from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
 
+from snowflake_semantic_tools.core.parsing.parsers import manifest_parser
 from snowflake_semantic_tools.core.parsing.parsers.manifest_parser import ManifestParser
 
 
-@pytest.fixture
+def _freeze(value):
+    """Recursively wrap dicts in read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+def _with_target(manifest, target_name):
+    """Copy of a frozen manifest with a different metadata.target_name."""
+    return {**manifest, "metadata": {**manifest["metadata"], "target_name": target_name}}
+
+
+@pytest.fixture(scope="session")
 def sample_manifest():
-    """Create a sample manifest structure for testing."""
-    return {
-        "metadata": {"dbt_version": "1.7.0", "target_name": "prod", "project_name": "analytics_dbt"},
-        "nodes": {
-            "model.analytics_dbt.memberships_members": {
-                "resource_type": "model",
-                "database": "ANALYTICS",
-                "schema": "MEMBERSHIPS",
-                "name": "memberships_members",
-                "alias": "memberships_members",
-                "relation_name": '"ANALYTICS"."MEMBERSHIPS"."MEMBERSHIPS_MEMBERS"',
-                "original_file_path": "models/analytics/memberships/memberships_members.sql",
-            },
-            "model.analytics_dbt.int_memberships_prep": {
-                "resource_type": "model",
-                "database": "ANALYTICS_INTERMEDIATE",
-                "schema": "INT_MEMBERSHIPS",
-                "name": "int_memberships_prep",
-                "alias": "int_memberships_prep",
-                "relation_name": '"ANALYTICS_INTERMEDIATE"."INT_MEMBERSHIPS"."INT_MEMBERSHIPS_PREP"',
-                "original_file_path": "models/analytics/memberships/_intermediate/int_memberships_prep.sql",
+    """Sample manifest structure shared by all tests; frozen so no test can leak mutations."""
+    return _freeze(
+        {
+            "metadata": {"dbt_version": "1.7.0", "target_name": "prod", "project_name": "analytics_dbt"},
+            "nodes": {
+                "model.analytics_dbt.memberships_members": {
+                    "resource_type": "model",
+                    "database": "ANALYTICS",
+                    "schema": "MEMBERSHIPS",
+                    "name": "memberships_members",
+                    "alias": "memberships_members",
+                    "relation_name": '"ANALYTICS"."MEMBERSHIPS"."MEMBERSHIPS_MEMBERS"',
+                    "original_file_path": "models/analytics/memberships/memberships_members.sql",
+                },
+                "model.analytics_dbt.int_memberships_prep": {
+                    "resource_type": "model",
+                    "database": "ANALYTICS_INTERMEDIATE",
+                    "schema": "INT_MEMBERSHIPS",
+                    "name": "int_memberships_prep",
+                    "alias": "int_memberships_prep",
+                    "relation_name": '"ANALYTICS_INTERMEDIATE"."INT_MEMBERSHIPS"."INT_MEMBERSHIPS_PREP"',
+                    "original_file_path": "models/analytics/memberships/_intermediate/int_memberships_prep.sql",
+                },
+                "test.analytics_dbt.test_members": {
+                    "resource_type": "test",
+                    "database": "ANALYTICS",
+                    "schema": "MEMBERSHIPS",
+                    "name": "test_members",
+                },
+                "seed.analytics_dbt.seed_data": {
+                    "resource_type": "seed",
+                    "database": "ANALYTICS",
+                    "schema": "PUBLIC",
+                    "name": "seed_data",
+                },
             },
-            "test.analytics_dbt.test_members": {
-                "resource_type": "test",
-                "database": "ANALYTICS",
-                "schema": "MEMBERSHIPS",
-                "name": "test_members",
-            },
-            "seed.analytics_dbt.seed_data": {
-                "resource_type": "seed",
-                "database": "ANALYTICS",
-                "schema": "PUBLIC",
-                "name": "seed_data",
-            },
-        },
-    }
+        }
+    )
 
 
 @pytest.fixture
@@ -60,7 +77,7 @@ def manifest_file(tmp_path, sample_manifest):
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(manifest_path, "w") as f:
-        json.dump(sample_manifest, f)
+        json.dump(sample_manifest, f, default=dict)
 
     return manifest_path
 
@@ -108,6 +125,56 @@ class TestManifestParser:
         assert result is False
         assert parser.manifest is None
 
+    def test_load_reuses_location_index(self, manifest_file):
+        """Test that loading an unchanged manifest again reuses its index but not its objects."""
+        first = ManifestParser(manifest_path=manifest_file)
+        second = ManifestParser(manifest_path=manifest_file)
+        assert first.load() is True
+        with patch.object(manifest_parser, "_build_location_cache") as build_index:
+            assert second.load() is True
+
+        build_index.assert_not_called()
+        assert second.manifest == first.manifest
+        assert second.manifest is not first.manifest
+        assert second.model_locations == first.model_locations
+        assert second.model_locations["memberships_members"] is not first.model_locations["memberships_members"]
+
+    def test_from_dict_matches_load(self, manifest_file):
+        """Test that a parser built from a decoded manifest indexes it like load()."""
+        loaded = ManifestParser(manifest_path=manifest_file)
+        loaded.load()
+        in_memory = ManifestParser.from_dict(json.loads(manifest_file.read_text()), manifest_file)
+
+        assert in_memory.model_locations == loaded.model_locations
+        assert in_memory.get_summary() == loaded.get_summary()
+        assert in_memory.get_target_name() == "prod"
+
+    def test_load_picks_up_rewritten_manifest(self, manifest_file, sample_manifest):
+        """Test that a recompiled manifest is indexed again instead of served stale."""
+        parser = ManifestParser(manifest_path=manifest_file)
+        parser.load()
+        assert parser.get_location("memberships_members")["database"] == "ANALYTICS"
+
+        node_id = "model.analytics_dbt.memberships_members"
+        moved_node = {**sample_manifest["nodes"][node_id], "database": "ANALYTICS_V2", "schema": "MEMBERS"}
+        with open(manifest_file, "w") as f:
+            json.dump({**sample_manifest, "nodes": {**sample_manifest["nodes"], node_id: moved_node}}, f, default=dict)
+
+        reloaded = ManifestParser(manifest_path=manifest_file)
+        reloaded.load()
+        location = reloaded.get_location("memberships_members")
+        assert (location["database"], location["schema"]) == ("ANALYTICS_V2", "MEMBERS")
+
+    def test_relative_and_absolute_paths_share_location_index(self, manifest_file, monkeypatch):
+        """Test that the location index is keyed on the resolved manifest path."""
+        monkeypatch.chdir(manifest_file.parent.parent)
+        assert ManifestParser(manifest_path=Path("target") / "manifest.json").load() is True
+
+        with patch.object(manifest_parser, "_build_location_cache") as build_index:
+            assert ManifestParser(manifest_path=manifest_file.resolve()).load() is True
+
+        build_index.assert_not_called()
+
     def test_build_location_cache(self, manifest_file):
         """Test that location cache is built correctly."""
         parser = ManifestParser(manifest_path=manifest_file)
@@ -185,6 +252,21 @@ class TestManifestParser:
 
         assert location is None
 
+    def test_get_location_by_path_name_differs_from_stem(self):
+        """Test path matching for models whose name is not the file stem (e.g. versioned models)."""
+        parser = ManifestParser()
+        parser.model_locations = {
+            "orders": {"database": "ANALYTICS", "schema": "SALES", "original_file_path": "models/sales/orders_v2.sql"},
+        }
+
+        location = parser.get_location_by_path(Path("/repo/dbt/models/sales/orders_v2.sql"))
+        assert location is not None
+        assert location["schema"] == "SALES"
+
+        # Replacing model_locations must not serve results from the previous index
+        parser.model_locations = {}
+        assert parser.get_location_by_path(Path("/repo/dbt/models/sales/orders_v2.sql")) is None
+
     def test_get_all_models_in_directory(self, manifest_file):
         """Test getting all models in a specific directory."""
         parser = ManifestParser(manifest_path=manifest_file)
@@ -229,12 +311,10 @@ class TestManifestParser:
 
     def test_is_prod_target_false(self, tmp_path, sample_manifest):
         """Test production target detection - false case."""
-        # Modify manifest to have dev target
-        sample_manifest["metadata"]["target_name"] = "dev"
-
+        # Manifest with a dev target
         manifest_path = tmp_path / "manifest.json"
         with open(manifest_path, "w") as f:
-            json.dump(sample_manifest, f)
+            json.dump(_with_target(sample_manifest, "dev"), f, default=dict)
 
         parser = ManifestParser(manifest_path=manifest_path)
         parser.load()
@@ -393,7 +473,7 @@ class TestManifestStalenessDetection:
 
         # Create a manifest file
         manifest_path = tmp_path / "manifest.json"
-        manifest_path.write_text(json.dumps(sample_manifest))
+        manifest_path.write_text(json.dumps(sample_manifest, default=dict))
 
         # Modify file timestamp to make it old (25 hours ago)
         old_time = time.time() - (25 * 3600)  # 25 hours ago
@@ -415,7 +495,7 @@ class TestManifestStalenessDetection:
 
         # Create a manifest file
         manifest_path = tmp_path / "manifest.json"
-        manifest_path.write_text(json.dumps(sample_manifest))
+        manifest_path.write_text(json.dumps(sample_manifest, default=dict))
 
         # Make manifest timestamp old
         old_time = time.time() - 10  # 10 seconds ago
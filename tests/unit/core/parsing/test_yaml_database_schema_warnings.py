@@ -56,6 +56,18 @@ class TestYAMLDatabaseSchemaWarnings:
         # Check that schema is empty (YAML was ignored)
         assert result["schema"] == ""
 
+    def test_ignored_field_warning_carries_structured_fields(self, caplog):
+        """Test that the warning exposes model, field and file as record attributes for filtering."""
+        model = {"name": "test_model", "meta": {"sst": {"schema": "MEMBERSHIPS"}}}
+
+        extract_table_info(model, Path("models/test.yml"), target_database=None, manifest_parser=None)
+
+        records = [record for record in caplog.records if hasattr(record, "ignored_field")]
+        assert len(records) == 1
+        assert records[0].ignored_field == "schema"
+        assert records[0].model == "test_model"
+        assert records[0].source_file == str(Path("models/test.yml"))
+
     def test_yaml_database_and_schema_both_warned(self, caplog):
         """Test that both database and schema generate separate warnings."""
         model = {
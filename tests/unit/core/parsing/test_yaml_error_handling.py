@@ -5,7 +5,6 @@ Tests that YAML parsing errors fail loudly with helpful error messages
 instead of being silently ignored.
 """
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -23,11 +22,17 @@ class TestYAMLErrorHandling:
         """Create Parser instance."""
         return Parser(enable_template_resolution=True)
 
+    @pytest.fixture(scope="class")
+    def shared_dir(self, tmp_path_factory):
+        """Create one directory for the whole class instead of a TemporaryDirectory per test."""
+        return tmp_path_factory.mktemp("yaml_errors")
+
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    def temp_dir(self, shared_dir, request):
+        """Give each test its own subdirectory of the shared directory."""
+        test_dir = shared_dir / request.node.name
+        test_dir.mkdir()
+        return test_dir
 
     def test_unquoted_colon_raises_parsing_error(self, parser, temp_dir):
         """Test that unquoted colons in descriptions raise ParsingCriticalError."""
@@ -2,13 +2,36 @@
 Tests for ManifestDiff dataclass and ManifestParser.compare_to() method.
 """
 
-import json
-from pathlib import Path
+from functools import lru_cache
 
 import pytest
 
 from snowflake_semantic_tools.core.parsing.parsers.manifest_parser import ManifestDiff, ManifestParser
 
+_MODEL_NODE_TEMPLATE = {"resource_type": "model", "database": "ANALYTICS", "schema": "PUBLIC"}
+
+
+@lru_cache(maxsize=64)
+def _build_manifest_dict(models: tuple) -> dict:
+    """Build manifest content for (model_name, checksum) pairs; callers treat it as read-only."""
+    nodes = {
+        f"model.project.{model_name}": {**_MODEL_NODE_TEMPLATE, "name": model_name, "checksum": {"checksum": checksum}}
+        for model_name, checksum in models
+    }
+
+    return {
+        "nodes": nodes,
+        "metadata": {
+            "dbt_version": "1.7.0",
+            "target_name": "prod",
+        },
+    }
+
+
+def _inproc_parser(models: dict) -> ManifestParser:
+    """Create an in-memory parser for {"model_name": "checksum", ...}; equal model sets share one manifest dict."""
+    return ManifestParser.from_dict(_build_manifest_dict(tuple(models.items())))
+
 
 class TestManifestDiff:
     """Tests for ManifestDiff dataclass."""
@@ -52,133 +75,86 @@ class TestManifestDiff:
 class TestManifestParserComparison:
     """Tests for ManifestParser.compare_to() method."""
 
-    def create_manifest(self, tmp_path: Path, name: str, models: dict) -> ManifestParser:
-        """Helper to create a manifest file and parser."""
-        manifest_dir = tmp_path / name
-        manifest_dir.mkdir(exist_ok=True)
-        manifest_path = manifest_dir / "manifest.json"
-
-        # Build nodes from models dict
-        # models = {"model_name": "checksum", ...}
-        nodes = {}
-        for model_name, checksum in models.items():
-            node_id = f"model.project.{model_name}"
-            nodes[node_id] = {
-                "resource_type": "model",
-                "name": model_name,
-                "database": "ANALYTICS",
-                "schema": "PUBLIC",
-                "checksum": {"checksum": checksum},
-            }
-
-        manifest_data = {
-            "nodes": nodes,
-            "metadata": {
-                "dbt_version": "1.7.0",
-                "target_name": "prod",
-            },
-        }
-
-        manifest_path.write_text(json.dumps(manifest_data))
-
-        parser = ManifestParser(manifest_path)
-        parser.load()
-        return parser
-
-    def test_compare_identical_manifests(self, tmp_path):
-        """Test comparing identical manifests."""
-        models = {"customers": "abc123", "orders": "def456"}
-
-        parser1 = self.create_manifest(tmp_path, "manifest1", models)
-        parser2 = self.create_manifest(tmp_path, "manifest2", models)
-
-        diff = parser1.compare_to(parser2)
-
-        assert diff.added == []
-        assert diff.removed == []
-        assert diff.modified == []
-        assert sorted(diff.unchanged) == ["customers", "orders"]
-
-    def test_compare_with_added_models(self, tmp_path):
-        """Test comparing when current has new models."""
-        current_models = {"customers": "abc123", "orders": "def456", "products": "ghi789"}
-        reference_models = {"customers": "abc123", "orders": "def456"}
-
-        current = self.create_manifest(tmp_path, "current", current_models)
-        reference = self.create_manifest(tmp_path, "reference", reference_models)
+    @pytest.mark.parametrize(
+        "current_models,reference_models,added,removed,modified,unchanged",
+        [
+            pytest.param(
+                {"customers": "abc123", "orders": "def456"},
+                {"customers": "abc123", "orders": "def456"},
+                [],
+                [],
+                [],
+                ["customers", "orders"],
+                id="identical",
+            ),
+            pytest.param(
+                {"customers": "abc123", "orders": "def456", "products": "ghi789"},
+                {"customers": "abc123", "orders": "def456"},
+                ["products"],
+                [],
+                [],
+                ["customers", "orders"],
+                id="added",
+            ),
+            pytest.param(
+                {"customers": "abc123"},
+                {"customers": "abc123", "orders": "def456"},
+                [],
+                ["orders"],
+                [],
+                ["customers"],
+                id="removed",
+            ),
+            pytest.param(
+                {"customers": "new_checksum", "orders": "def456"},
+                {"customers": "old_checksum", "orders": "def456"},
+                [],
+                [],
+                ["customers"],
+                ["orders"],
+                id="modified",
+            ),
+            pytest.param(
+                {"unchanged_model": "same123", "modified_model": "new456", "new_model": "brand789"},
+                {"unchanged_model": "same123", "modified_model": "old456", "deleted_model": "gone000"},
+                ["new_model"],
+                ["deleted_model"],
+                ["modified_model"],
+                ["unchanged_model"],
+                id="complex",
+            ),
+            pytest.param({}, {}, [], [], [], [], id="empty"),
+        ],
+    )
+    def test_compare_scenarios(self, current_models, reference_models, added, removed, modified, unchanged):
+        """Test compare_to classifies each model as added, removed, modified or unchanged."""
+        current = _inproc_parser(current_models)
+        reference = _inproc_parser(reference_models)
 
         diff = current.compare_to(reference)
 
-        assert diff.added == ["products"]
-        assert diff.removed == []
-        assert diff.modified == []
-
-    def test_compare_with_removed_models(self, tmp_path):
-        """Test comparing when reference has models that current doesn't."""
-        current_models = {"customers": "abc123"}
-        reference_models = {"customers": "abc123", "orders": "def456"}
-
-        current = self.create_manifest(tmp_path, "current", current_models)
-        reference = self.create_manifest(tmp_path, "reference", reference_models)
-
-        diff = current.compare_to(reference)
-
-        assert diff.added == []
-        assert diff.removed == ["orders"]
-        assert diff.modified == []
-
-    def test_compare_with_modified_models(self, tmp_path):
-        """Test comparing when checksums differ."""
-        current_models = {"customers": "new_checksum", "orders": "def456"}
-        reference_models = {"customers": "old_checksum", "orders": "def456"}
-
-        current = self.create_manifest(tmp_path, "current", current_models)
-        reference = self.create_manifest(tmp_path, "reference", reference_models)
-
-        diff = current.compare_to(reference)
-
-        assert diff.added == []
-        assert diff.removed == []
-        assert diff.modified == ["customers"]
-        assert diff.unchanged == ["orders"]
-
-    def test_compare_complex_diff(self, tmp_path):
-        """Test complex comparison with all change types."""
-        current_models = {
-            "unchanged_model": "same123",
-            "modified_model": "new456",
-            "new_model": "brand789",
-        }
-        reference_models = {
-            "unchanged_model": "same123",
-            "modified_model": "old456",
-            "deleted_model": "gone000",
+        assert diff.added == added
+        assert diff.removed == removed
+        assert diff.modified == modified
+        assert diff.unchanged == unchanged
+        assert diff.total_changes == len(added) + len(modified)
+
+    def test_checksum_uses_first_model_node_with_name(self):
+        """Test versioned models sharing a name resolve to the first node's checksum."""
+        nodes = {
+            f"model.project.customers.{version}": {
+                **_MODEL_NODE_TEMPLATE,
+                "name": "customers",
+                "checksum": {"checksum": f"{version}sum"},
+            }
+            for version in ("v1", "v2")
         }
+        parser = ManifestParser.from_dict({"nodes": nodes, "metadata": {}})
 
-        current = self.create_manifest(tmp_path, "current", current_models)
-        reference = self.create_manifest(tmp_path, "reference", reference_models)
+        assert parser._get_model_checksum("customers") == "v1sum"
+        assert parser._get_model_checksum("missing") is None
 
-        diff = current.compare_to(reference)
-
-        assert diff.added == ["new_model"]
-        assert diff.removed == ["deleted_model"]
-        assert diff.modified == ["modified_model"]
-        assert diff.unchanged == ["unchanged_model"]
-        assert diff.total_changes == 2  # added + modified
-
-    def test_compare_empty_manifests(self, tmp_path):
-        """Test comparing empty manifests."""
-        current = self.create_manifest(tmp_path, "current", {})
-        reference = self.create_manifest(tmp_path, "reference", {})
-
-        diff = current.compare_to(reference)
-
-        assert diff.added == []
-        assert diff.removed == []
-        assert diff.modified == []
-        assert diff.unchanged == []
-
-    def test_compare_unloaded_manifests(self, tmp_path):
+    def test_compare_unloaded_manifests(self):
         """Test comparing when manifests aren't loaded."""
         parser1 = ManifestParser()
         parser2 = ManifestParser()
@@ -195,9 +171,8 @@ class TestManifestParserComparison:
 class TestGetModelsForTables:
     """Tests for ManifestParser.get_models_for_tables() method."""
 
-    def test_get_models_simple(self, tmp_path):
+    def test_get_models_simple(self):
         """Test getting models for simple table names."""
-        manifest_path = tmp_path / "manifest.json"
         manifest_data = {
             "nodes": {
                 "model.project.customers": {
@@ -214,19 +189,15 @@ class TestGetModelsForTables:
                 },
             },
         }
-        manifest_path.write_text(json.dumps(manifest_data))
-
-        parser = ManifestParser(manifest_path)
-        parser.load()
+        parser = ManifestParser.from_dict(manifest_data)
 
         models = parser.get_models_for_tables(["customers", "orders"])
 
         assert "customers" in models
         assert "orders" in models
 
-    def test_get_models_qualified_names(self, tmp_path):
+    def test_get_models_qualified_names(self):
         """Test getting models for fully qualified table names."""
-        manifest_path = tmp_path / "manifest.json"
         manifest_data = {
             "nodes": {
                 "model.project.customers": {
@@ -237,19 +208,15 @@ class TestGetModelsForTables:
                 },
             },
         }
-        manifest_path.write_text(json.dumps(manifest_data))
-
-        parser = ManifestParser(manifest_path)
-        parser.load()
+        parser = ManifestParser.from_dict(manifest_data)
 
         # Should extract table name from fully qualified reference
         models = parser.get_models_for_tables(["ANALYTICS.PUBLIC.CUSTOMERS"])
 
         assert "customers" in models
 
-    def test_get_models_case_insensitive(self, tmp_path):
+    def test_get_models_case_insensitive(self):
         """Test that model matching is case-insensitive."""
-        manifest_path = tmp_path / "manifest.json"
         manifest_data = {
             "nodes": {
                 "model.project.customers": {
@@ -260,10 +227,7 @@ class TestGetModelsForTables:
                 },
             },
         }
-        manifest_path.write_text(json.dumps(manifest_data))
-
-        parser = ManifestParser(manifest_path)
-        parser.load()
+        parser = ManifestParser.from_dict(manifest_data)
 
         models = parser.get_models_for_tables(["CUSTOMERS"])
 
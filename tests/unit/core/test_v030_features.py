@@ -489,6 +489,27 @@ class TestResolveDerivedMetricExpr:
         result = parser._resolve_derived_metric_expr("derived_m", raw_content)
         assert result == "ORPHAN"
 
+    def test_file_parsed_once_for_several_derived_metrics(self):
+        from unittest.mock import patch
+
+        from snowflake_semantic_tools.core.parsing import parser as parser_module
+
+        raw_content = """snowflake_metrics:
+  - name: first_ratio
+    derived: true
+    expr: "{{ metric('x') }} / 2"
+  - name: second_ratio
+    derived: true
+    expr: "{{ metric('x') }} / 3"
+"""
+        catalog = [{"name": "X", "tables": ["{{ ref('a') }}"]}]
+        parser = self._make_parser(catalog)
+        parser_module._load_metrics_with_neutralized_jinja.cache_clear()
+        with patch.object(parser_module, "safe_load_yaml", wraps=parser_module.safe_load_yaml) as mock_load:
+            assert parser._resolve_derived_metric_expr("first_ratio", raw_content) == "A.X / 2"
+            assert parser._resolve_derived_metric_expr("second_ratio", raw_content) == "A.X / 3"
+        assert mock_load.call_count == 1
+
 
 class TestAutoInferTablesFromExpr:
     """Test that tables field is auto-inferred from expr when omitted (#96)."""
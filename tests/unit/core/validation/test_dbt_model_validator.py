@@ -9,25 +9,37 @@ import pytest
 from snowflake_semantic_tools.core.models.validation import ValidationSeverity
 from snowflake_semantic_tools.core.validation.rules.dbt_models import DbtModelValidator
 
+# Valid tables the column-level cases attach to; DbtModelValidator.validate does not mutate its input
+_TEST_TABLE_SM_TABLES = (
+    {
+        "table_name": "TEST_TABLE",
+        "database": "ANALYTICS",
+        "schema": "TEST",
+        "primary_key": ["id"],
+    },
+)
+_MY_TABLE_SM_TABLES = (
+    {
+        "table_name": "MY_TABLE",
+        "database": "ANALYTICS",
+        "schema": "TEST",
+        "primary_key": ["id"],
+    },
+)
+
 
 class TestDbtModelValidator:
     """Test DbtModelValidator validation logic."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = DbtModelValidator()
+    @classmethod
+    def setup_class(cls):
+        """Set up one validator for the class; it keeps no state between validate() calls."""
+        cls.validator = DbtModelValidator()
 
     def test_valid_column_types(self):
         """Test that valid column_type values pass validation."""
         dbt_data = {
-            "sm_tables": [
-                {
-                    "table_name": "TEST_TABLE",
-                    "database": "ANALYTICS",
-                    "schema": "TEST",
-                    "primary_key": ["id"],
-                }
-            ],
+            "sm_tables": _TEST_TABLE_SM_TABLES,
             "sm_dimensions": {
                 "items": [
                     {
@@ -68,14 +80,7 @@ class TestDbtModelValidator:
     def test_invalid_column_type_dimenson(self):
         """Test that 'dimenson' typo is caught as an error."""
         dbt_data = {
-            "sm_tables": [
-                {
-                    "table_name": "TEST_TABLE",
-                    "database": "ANALYTICS",
-                    "schema": "TEST",
-                    "primary_key": ["id"],
-                }
-            ],
+            "sm_tables": _TEST_TABLE_SM_TABLES,
             "sm_dimensions": {
                 "items": [
                     {
@@ -101,62 +106,47 @@ class TestDbtModelValidator:
         assert len(column_type_errors) == 1
         assert "Must be one of: dimension, fact, time_dimension" in column_type_errors[0].message
 
-    def test_invalid_column_type_various_typos(self):
-        """Test various column_type typos are caught."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "invalid_type,description",
+        [
             ("dimensoin", "dimension typo"),
             ("fac", "fact typo"),
             ("tim_dimension", "time_dimension typo"),
             ("measure", "old measure term"),
             ("metric", "old metric term"),
             ("time", "old time term"),
-        ]
-
-        for invalid_type, description in test_cases:
-            dbt_data = {
-                "sm_tables": [
+        ],
+    )
+    def test_invalid_column_type_various_typos(self, invalid_type, description):
+        """Test various column_type typos are caught."""
+        dbt_data = {
+            "sm_tables": _TEST_TABLE_SM_TABLES,
+            "sm_dimensions": {
+                "items": [
                     {
                         "table_name": "TEST_TABLE",
-                        "database": "ANALYTICS",
-                        "schema": "TEST",
-                        "primary_key": ["id"],
+                        "name": "bad_col",
+                        "column_type": invalid_type,
+                        "data_type": "text",
                     }
-                ],
-                "sm_dimensions": {
-                    "items": [
-                        {
-                            "table_name": "TEST_TABLE",
-                            "name": "bad_col",
-                            "column_type": invalid_type,
-                            "data_type": "text",
-                        }
-                    ]
-                },
-            }
-
-            result = self.validator.validate(dbt_data)
-
-            # Should have an error about invalid column_type
-            column_type_errors = [
-                issue
-                for issue in result.issues
-                if issue.severity == ValidationSeverity.ERROR
-                and "invalid column_type" in issue.message
-                and invalid_type in issue.message
-            ]
-            assert len(column_type_errors) == 1, f"Failed to catch {description}: {invalid_type}"
+                ]
+            },
+        }
+
+        result = self.validator.validate(dbt_data)
+
+        # Should have exactly one invalid column_type error (SST-V007), keyed by the offending value
+        flagged_types = [
+            issue.context.get("column_type")
+            for issue in result.issues
+            if issue.severity == ValidationSeverity.ERROR and issue.rule_id == "SST-V007"
+        ]
+        assert flagged_types == [invalid_type], f"Failed to catch {description}: {invalid_type}"
 
     def test_empty_column_type_not_validated(self):
         """Test that empty/missing column_type doesn't trigger the invalid type error."""
         dbt_data = {
-            "sm_tables": [
-                {
-                    "table_name": "TEST_TABLE",
-                    "database": "ANALYTICS",
-                    "schema": "TEST",
-                    "primary_key": ["id"],
-                }
-            ],
+            "sm_tables": _TEST_TABLE_SM_TABLES,
             "sm_dimensions": {
                 "items": [
                     {"table_name": "TEST_TABLE", "name": "col_no_type", "column_type": "", "data_type": "text"}  # Empty
@@ -182,14 +172,7 @@ class TestDbtModelValidator:
     def test_column_type_error_context(self):
         """Test that column_type errors include proper context."""
         dbt_data = {
-            "sm_tables": [
-                {
-                    "table_name": "MY_TABLE",
-                    "database": "ANALYTICS",
-                    "schema": "TEST",
-                    "primary_key": ["id"],
-                }
-            ],
+            "sm_tables": _MY_TABLE_SM_TABLES,
             "sm_dimensions": {
                 "items": [
                     {"table_name": "MY_TABLE", "name": "my_column", "column_type": "invalid_type", "data_type": "text"}
@@ -10,16 +10,25 @@ which is a Snowflake constraint (GitHub issue #84).
 """
 
 import json
+from functools import lru_cache
 
 import pytest
 
 from snowflake_semantic_tools.core.validation.rules.duplicates import DuplicateValidator
 
+_IDENTICAL_TABLES_WARNING = "identical table lists"
+
+
+@lru_cache(maxsize=None)
+def _tables_json(*tables: str) -> str:
+    """Encode a semantic view table list as the JSON string the parser stores."""
+    return json.dumps(list(tables))
+
 
 class TestSemanticViewDuplicateDetection:
     """Test duplicate detection for semantic views."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
         """Create a duplicate detector instance."""
         return DuplicateValidator()
@@ -38,13 +47,13 @@ class TestSemanticViewDuplicateDetection:
                 "items": [
                     {
                         "name": "growth_trials_engagement",
-                        "tables": json.dumps(
-                            ["{{ table('single_customer_view') }}", "{{ table('user_cycle_active_periods') }}"]
+                        "tables": _tables_json(
+                            "{{ table('single_customer_view') }}", "{{ table('user_cycle_active_periods') }}"
                         ),
                     },
                     {
                         "name": "upcycle_lifecycle",
-                        "tables": json.dumps(["{{ table('single_customer_view') }}", "{{ table('upgrade_upcycle') }}"]),
+                        "tables": _tables_json("{{ table('single_customer_view') }}", "{{ table('upgrade_upcycle') }}"),
                     },
                 ]
             }
@@ -54,11 +63,10 @@ class TestSemanticViewDuplicateDetection:
 
         # Should NOT have warnings about identical table lists
         # (they share single_customer_view but have different second tables)
-        identical_warnings = [w for w in result.get_warnings() if "identical table lists" in w.message.lower()]
-
-        assert (
-            len(identical_warnings) == 0
-        ), f"Expected no 'identical table lists' warnings, but got: {identical_warnings}"
+        warnings = result.get_warnings()
+        assert not any(
+            _IDENTICAL_TABLES_WARNING in w.message.lower() for w in warnings
+        ), f"Expected no 'identical table lists' warnings, but got: {warnings}"
 
     def test_semantic_views_with_truly_identical_tables_json_string(self, detector):
         """
@@ -68,11 +76,11 @@ class TestSemanticViewDuplicateDetection:
         semantic_data = {
             "semantic_views": {
                 "items": [
-                    {"name": "view1", "tables": json.dumps(["{{ table('table_a') }}", "{{ table('table_b') }}"])},
+                    {"name": "view1", "tables": _tables_json("{{ table('table_a') }}", "{{ table('table_b') }}")},
                     {
                         "name": "view2",
-                        "tables": json.dumps(
-                            ["{{ table('table_b') }}", "{{ table('table_a') }}"]  # Same tables, different order
+                        "tables": _tables_json(
+                            "{{ table('table_b') }}", "{{ table('table_a') }}"  # Same tables, different order
                         ),
                     },
                 ]
@@ -82,7 +90,7 @@ class TestSemanticViewDuplicateDetection:
         result = detector.validate(semantic_data)
 
         # SHOULD have warning about identical table lists (order-independent)
-        identical_warnings = [w for w in result.get_warnings() if "identical table lists" in w.message.lower()]
+        identical_warnings = [w for w in result.get_warnings() if _IDENTICAL_TABLES_WARNING in w.message.lower()]
 
         assert (
             len(identical_warnings) == 1
@@ -109,11 +117,10 @@ class TestSemanticViewDuplicateDetection:
         result = detector.validate(semantic_data)
 
         # Should NOT have warnings about identical table lists
-        identical_warnings = [w for w in result.get_warnings() if "identical table lists" in w.message.lower()]
-
-        assert (
-            len(identical_warnings) == 0
-        ), f"Expected no 'identical table lists' warnings, but got: {identical_warnings}"
+        warnings = result.get_warnings()
+        assert not any(
+            _IDENTICAL_TABLES_WARNING in w.message.lower() for w in warnings
+        ), f"Expected no 'identical table lists' warnings, but got: {warnings}"
 
     def test_semantic_views_with_invalid_json_string(self, detector):
         """
@@ -151,18 +158,18 @@ class TestSemanticViewDuplicateDetection:
         semantic_data = {
             "semantic_views": {
                 "items": [
-                    {"name": "unique_view", "tables": json.dumps(["{{ table('unique_table') }}"])},
+                    {"name": "unique_view", "tables": _tables_json("{{ table('unique_table') }}")},
                     {
                         "name": "duplicate_view_1",
-                        "tables": json.dumps(["{{ table('shared_a') }}", "{{ table('shared_b') }}"]),
+                        "tables": _tables_json("{{ table('shared_a') }}", "{{ table('shared_b') }}"),
                     },
                     {
                         "name": "duplicate_view_2",
-                        "tables": json.dumps(
-                            ["{{ table('shared_b') }}", "{{ table('shared_a') }}"]  # Same tables, different order
+                        "tables": _tables_json(
+                            "{{ table('shared_b') }}", "{{ table('shared_a') }}"  # Same tables, different order
                         ),
                     },
-                    {"name": "another_unique_view", "tables": json.dumps(["{{ table('another_unique') }}"])},
+                    {"name": "another_unique_view", "tables": _tables_json("{{ table('another_unique') }}")},
                 ]
             }
         }
@@ -170,7 +177,7 @@ class TestSemanticViewDuplicateDetection:
         result = detector.validate(semantic_data)
 
         # Should have exactly 1 warning for the duplicate pair
-        identical_warnings = [w for w in result.get_warnings() if "identical table lists" in w.message.lower()]
+        identical_warnings = [w for w in result.get_warnings() if _IDENTICAL_TABLES_WARNING in w.message.lower()]
 
         assert len(identical_warnings) == 1
         assert "duplicate_view_1" in identical_warnings[0].message
@@ -190,7 +197,7 @@ class TestTableSynonymDuplicateDetection:
     across tables because the same column concept may exist in multiple tables.
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def detector(self):
         """Create a duplicate detector instance."""
         return DuplicateValidator()
@@ -347,7 +354,7 @@ class TestTableSynonymDuplicateDetection:
                 "items": [
                     {
                         "name": "view",
-                        "tables": json.dumps(["ORDERS", "ORDER_ITEMS"]),  # JSON string
+                        "tables": _tables_json("ORDERS", "ORDER_ITEMS"),  # JSON string
                     },
                 ]
             }
@@ -445,7 +452,7 @@ class TestTableSynonymDuplicateDetection:
 class TestV091MetricDuplicateDetection:
     """V091: metrics with same expr but different modifiers are NOT duplicates."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def validator(self):
         return DuplicateValidator()
 
@@ -18,6 +18,7 @@ from snowflake_semantic_tools.shared.utils.file_utils import (
     expand_path_pattern,
     get_dbt_model_paths,
     resolve_wildcard_path_for_enrich,
+    safe_load_yaml,
 )
 
 
@@ -502,3 +503,24 @@ class TestResolveWildcardPathForEnrich:
         assert target_path is None
         assert model_files is not None
         assert len(model_files) == 2
+
+
+class TestSafeLoadYaml:
+    """Test safe_load_yaml loader behaviour."""
+
+    def test_matches_yaml_safe_load(self):
+        """Test output is identical to yaml.safe_load."""
+        content = "models:\n  - name: orders\n    columns:\n      - {name: id, data_type: 1, tags: [a, b]}\n"
+        assert safe_load_yaml(content) == yaml.safe_load(content)
+
+    def test_short_strings_are_shared(self):
+        """Test repeated keys and short values come back as the same string object."""
+        data = safe_load_yaml("- {column_type: dimension}\n- {column_type: dimension}\n")
+        (first_key, first_value), (second_key, second_value) = (next(iter(item.items())) for item in data)
+        assert first_key is second_key
+        assert first_value is second_value
+
+    def test_unsafe_tags_rejected(self):
+        """Test the loader stays a safe loader."""
+        with pytest.raises(yaml.YAMLError):
+            safe_load_yaml("!!python/object/apply:os.system ['true']")